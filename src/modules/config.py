@@ -119,6 +119,7 @@ MESSAGE_PREVIEW_LENGTH = 10
 # ============================================================================
 SPRITE_SIZE = (100, 100)  # Width, Height
 SPRITE_FORMAT = "1"        # 1-bit (black & white)
+SPRITE_PRELOAD_WORKERS = 4  # Threads overlapping sprite file I/O at boot
 
 # Emotion Sprite File Names
 EMOTION_SPRITES = {
@@ -501,8 +502,13 @@ EMOJI_CATEGORIES = [
 WIFI_SERVICE_TYPE = "_notagotchi._tcp.local."
 WIFI_PORT = 5555
 WIFI_DISCOVERY_TIMEOUT = 5.0       # seconds
+WIFI_DISCOVERY_CACHE_TTL = 2.0     # seconds an avahi scan is shared between callers
 WIFI_CONNECTION_TIMEOUT = 10.0     # seconds
 WIFI_MESSAGE_MAX_SIZE = 8192       # bytes (8KB)
+WIFI_HANDLER_WORKERS = 4           # threads handling incoming connections
+WIFI_LOCAL_IP_TTL = 30.0           # seconds to reuse the resolved local IP
+DISCOVERY_CACHE_PATH = os.path.join(DATA_DIR, "discovery_cache.json")
+DISCOVERY_CACHE_MAX_AGE = 600.0    # seconds before cached scan results are dropped
 MESSAGE_ENCODING = "utf-8"
 
 # Service properties for mDNS advertisement
@@ -15,10 +15,18 @@ import time
 import sqlite3
 import threading
 from contextlib import contextmanager
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, FrozenSet
 from . import config
 
 
+# Shared by every friends insert so sqlite3's statement cache reuses one plan
+_INSERT_FRIEND_SQL = '''
+    INSERT INTO friends
+    (device_name, pet_name, last_ip, last_port, last_seen, friendship_established)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+
 class FriendManager:
     """
     Manages friend relationships and friend requests
@@ -45,6 +53,9 @@ class FriendManager:
         self.own_device_name = own_device_name
         self._lock = db_lock or threading.RLock()
 
+        # Cached friend device names; None until loaded or after a change
+        self._friend_names: Optional[FrozenSet[str]] = None
+
     @contextmanager
     def _db_lock(self):
         """Context manager for thread-safe database access"""
@@ -150,13 +161,10 @@ class FriendManager:
 
                 try:
                     # Add to friends table
-                    cursor.execute('''
-                        INSERT INTO friends
-                        (device_name, pet_name, last_ip, last_port, last_seen, friendship_established)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    ''', (request['from_device_name'], request['from_pet_name'],
-                          request['from_ip'], request['from_port'],
-                          current_time, current_time))
+                    cursor.execute(_INSERT_FRIEND_SQL,
+                                   (request['from_device_name'], request['from_pet_name'],
+                                    request['from_ip'], request['from_port'],
+                                    current_time, current_time))
 
                     # Update request status
                     cursor.execute('''
@@ -166,6 +174,7 @@ class FriendManager:
                     ''', (current_time, from_device_name))
 
                     self.connection.commit()
+                    self._friend_names = None
 
                 except Exception:
                     self.connection.rollback()
@@ -384,6 +393,30 @@ class FriendManager:
         with self._db_lock():
             return self._is_friend_internal(device_name)
 
+    def friend_name_set(self) -> FrozenSet[str]:
+        """
+        Get the device names of all friends
+
+        The set is cached and only reloaded after a friend is added or
+        removed, so filtering many devices costs one query at most.
+
+        Returns:
+            Frozen set of friend device names (excludes own device)
+        """
+        with self._db_lock():
+            if self._friend_names is None:
+                try:
+                    cursor = self.connection.cursor()
+                    cursor.execute('''
+                        SELECT device_name FROM friends WHERE device_name != ?
+                    ''', (self.own_device_name,))
+                    self._friend_names = frozenset(row[0] for row in cursor.fetchall())
+                except sqlite3.Error as e:
+                    print(f"❌ Error getting friend names: {e}")
+                    return frozenset()
+
+            return self._friend_names
+
     def update_friend_contact(self, device_name: str, ip: str, port: int) -> bool:
         """
         Update friend's last known IP/port and last seen time
@@ -438,28 +471,27 @@ class FriendManager:
         Returns:
             True if added successfully
         """
-        # Check if already friends
-        if self.is_friend(device_name):
-            print(f"Already friends with {device_name}")
-            return False
+        # Checks and insert share one lock acquisition
+        with self._db_lock():
+            # Check if already friends
+            if self._is_friend_internal(device_name):
+                print(f"Already friends with {device_name}")
+                return False
 
-        # Check friend limit
-        if not self.can_add_more_friends():
-            print(f"❌ Friend limit reached ({config.MAX_FRIENDS} friends)")
-            return False
+            # Check friend limit
+            if self._get_friend_count_internal() >= config.MAX_FRIENDS:
+                print(f"❌ Friend limit reached ({config.MAX_FRIENDS} friends)")
+                return False
 
-        with self._db_lock():
             try:
                 cursor = self.connection.cursor()
                 current_time = time.time()
 
-                cursor.execute('''
-                    INSERT INTO friends
-                    (device_name, pet_name, last_ip, last_port, last_seen, friendship_established)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (device_name, pet_name, ip, port, current_time, current_time))
+                cursor.execute(_INSERT_FRIEND_SQL,
+                               (device_name, pet_name, ip, port, current_time, current_time))
 
                 self.connection.commit()
+                self._friend_names = None
                 print(f"✅ {pet_name} added to friends!")
                 return True
 
@@ -516,6 +548,7 @@ class FriendManager:
                     stats['friend_removed'] = cursor.rowcount > 0
 
                     self.connection.commit()
+                    self._friend_names = None
 
                     print(f"✅ Removed friend {device_name}: " +
                           f"{stats['messages_deleted']} messages, " +
@@ -572,14 +605,7 @@ class FriendManager:
             Friend count
         """
         with self._db_lock():
-            try:
-                cursor = self.connection.cursor()
-                cursor.execute('SELECT COUNT(*) FROM friends')
-                return cursor.fetchone()[0]
-
-            except sqlite3.Error as e:
-                print(f"❌ Error counting friends: {e}")
-                return 0
+            return self._get_friend_count_internal()
 
     def can_add_more_friends(self) -> bool:
         """
@@ -594,6 +620,17 @@ class FriendManager:
     # PRIVATE HELPER METHODS
     # ========================================================================
 
+    def _get_friend_count_internal(self) -> int:
+        """Internal get_friend_count without lock - for use within locked context"""
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute('SELECT COUNT(*) FROM friends')
+            return cursor.fetchone()[0]
+
+        except sqlite3.Error as e:
+            print(f"❌ Error counting friends: {e}")
+            return 0
+
     def _get_pending_request_internal(self, from_device_name: str) -> Optional[Dict[str, Any]]:
         """Internal get_pending_request without lock - for use within locked context"""
         try:
@@ -9,6 +9,12 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, Callable, List
 import time
 from . import config
+from .logging_config import get_logger
+
+# Module logger
+logger = get_logger(__name__)
+
+_BANNER = '=' * 60
 
 
 class MessageHandler(ABC):
@@ -87,6 +93,10 @@ class MessageHandlerRegistry:
     def __init__(self):
         self._handlers: Dict[str, MessageHandler] = {}
 
+        # Bound handle() methods by type, kept in sync with _handlers so
+        # dispatch is one lookup and a direct call
+        self._dispatch: Dict[str, Callable] = {}
+
     def register(self, handler: MessageHandler) -> None:
         """
         Register a message handler.
@@ -94,8 +104,10 @@ class MessageHandlerRegistry:
         Args:
             handler: The handler to register
         """
-        self._handlers[handler.message_type] = handler
-        print(f"Registered handler for message type: {handler.message_type}")
+        message_type = handler.message_type
+        self._handlers[message_type] = handler
+        self._dispatch[message_type] = handler.handle
+        logger.debug("Registered handler for message type: %s", message_type)
 
     def unregister(self, message_type: str) -> bool:
         """
@@ -109,6 +121,7 @@ class MessageHandlerRegistry:
         """
         if message_type in self._handlers:
             del self._handlers[message_type]
+            del self._dispatch[message_type]
             return True
         return False
 
@@ -138,16 +151,17 @@ class MessageHandlerRegistry:
             True if message was handled, False if no handler found
         """
         message_type = message_data.get('type')
-        if not message_type:
-            print("⚠️  Message missing 'type' field")
-            return False
 
-        handler = self.get_handler(message_type)
-        if handler:
-            return handler.handle(message_data, sender_ip, context)
+        # Single hash lookup; a missing or unknown type both miss the table
+        handle = self._dispatch.get(message_type)
+        if handle:
+            return handle(message_data, sender_ip, context)
+
+        if not message_type:
+            logger.warning("⚠️  Message missing 'type' field")
         else:
-            print(f"⚠️  Unknown message type: {message_type}")
-            return False
+            logger.warning("⚠️  Unknown message type: %s", message_type)
+        return False
 
     @property
     def registered_types(self) -> List[str]:
@@ -168,16 +182,17 @@ class FriendRequestHandler(MessageHandler):
 
     def handle(self, message_data: Dict[str, Any], sender_ip: str,
                context: MessageHandlerContext) -> bool:
-        from_device_name = message_data.get('from_device_name')
-        from_pet_name = message_data.get('from_pet_name')
-        from_ip = message_data.get('from_ip', sender_ip)
-        from_port = message_data.get('from_port', config.WIFI_PORT)
-
-        print(f"\n{'='*60}")
-        print(f"📬 Friend request received!")
-        print(f"   From: {from_pet_name} ({from_device_name})")
-        print(f"   Address: {from_ip}:{from_port}")
-        print(f"{'='*60}\n")
+        get = message_data.get  # Bind once; called for every field
+        from_device_name = get('from_device_name')
+        from_pet_name = get('from_pet_name')
+        from_ip = get('from_ip', sender_ip)
+        from_port = get('from_port', config.WIFI_PORT)
+
+        # One write, formatted only if INFO is enabled
+        logger.info("\n%s\n📬 Friend request received!\n"
+                    "   From: %s (%s)\n   Address: %s:%s\n%s\n",
+                    _BANNER, from_pet_name, from_device_name,
+                    from_ip, from_port, _BANNER)
 
         # Store in database
         success = context.friends.receive_friend_request(
@@ -207,15 +222,15 @@ class FriendRequestAcceptedHandler(MessageHandler):
 
     def handle(self, message_data: Dict[str, Any], sender_ip: str,
                context: MessageHandlerContext) -> bool:
-        from_device_name = message_data.get('from_device_name')
-        from_pet_name = message_data.get('from_pet_name')
-        from_ip = message_data.get('from_ip', sender_ip)
-        from_port = message_data.get('from_port', config.WIFI_PORT)
+        get = message_data.get  # Bind once; called for every field
+        from_device_name = get('from_device_name')
+        from_pet_name = get('from_pet_name')
+        from_ip = get('from_ip', sender_ip)
+        from_port = get('from_port', config.WIFI_PORT)
 
-        print(f"\n{'='*60}")
-        print(f"🎉 Friend request accepted!")
-        print(f"   {from_pet_name} is now your friend!")
-        print(f"{'='*60}\n")
+        logger.info("\n%s\n🎉 Friend request accepted!\n"
+                    "   %s is now your friend!\n%s\n",
+                    _BANNER, from_pet_name, _BANNER)
 
         # Add to friends list (they accepted our request)
         success = context.friends.add_friend(
@@ -245,19 +260,20 @@ class ChatMessageHandler(MessageHandler):
 
     def handle(self, message_data: Dict[str, Any], sender_ip: str,
                context: MessageHandlerContext) -> bool:
-        from_device_name = message_data.get('from_device_name')
-        from_pet_name = message_data.get('from_pet_name')
-        content = message_data.get('content')
-        content_type = message_data.get('content_type', 'text')
-        message_id = message_data.get('message_id')
-        timestamp = message_data.get('timestamp', time.time())
+        get = message_data.get  # Bind once; called for every field
+        from_device_name = get('from_device_name')
+        from_pet_name = get('from_pet_name')
+        content = get('content')
+        content_type = get('content_type', 'text')
+        message_id = get('message_id')
+        timestamp = get('timestamp') or time.time()
 
         # Verify sender is a friend
         if not context.friends.is_friend(from_device_name):
-            print(f"⚠️  Ignoring message from non-friend: {from_device_name}")
+            logger.warning("⚠️  Ignoring message from non-friend: %s", from_device_name)
             return False
 
-        print(f"\n📬 Message from {from_pet_name}: {content}")
+        logger.info("📬 Message from %s: %s", from_pet_name, content)
 
         # Store message if message manager available
         if context.messages:
@@ -271,7 +287,7 @@ class ChatMessageHandler(MessageHandler):
             )
 
             if not success:
-                print(f"❌ Failed to store message from {from_pet_name}")
+                logger.error("❌ Failed to store message from %s", from_pet_name)
                 return False
 
         # Update friend's last_seen timestamp
@@ -285,9 +301,9 @@ class ChatMessageHandler(MessageHandler):
                 sender_ip,
                 friend['port']
             )
-            print(f"✅ Updated online status for {from_pet_name}")
+            logger.debug("✅ Updated online status for %s", from_pet_name)
         else:
-            print(f"⚠️  Could not find friend record for {from_device_name}")
+            logger.warning("⚠️  Could not find friend record for %s", from_device_name)
 
         # Notify UI
         if context.on_message_received:
@@ -5,13 +5,20 @@ Implements a formal state machine for screen navigation with plugin support.
 Screens can be registered dynamically for extensibility.
 """
 
+import sys
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, Callable, List, Set
-from dataclasses import dataclass, field
+from collections import deque
+from typing import Dict, Any, Optional, Callable, List, Set, FrozenSet, Tuple
+from dataclasses import dataclass
 from enum import Enum, auto
 from . import config
 
 
+def _noop(state_machine: 'ScreenStateMachine', other_state: str) -> None:
+    """Default enter/exit callback, so transitions can call hooks unconditionally."""
+    pass
+
+
 class TransitionResult(Enum):
     """Result of a state transition attempt."""
     SUCCESS = auto()
@@ -27,23 +34,22 @@ class ScreenState:
 
     Attributes:
         name: Unique identifier for the state
-        allowed_transitions: Set of state names this state can transition to
-        on_enter: Optional callback when entering this state
-        on_exit: Optional callback when exiting this state
-        data: Optional arbitrary data associated with this state
+        allowed_transitions: Frozen set of state names this state can
+            transition to (None = all transitions allowed)
+        on_enter: Callback when entering this state (no-op by default)
+        on_exit: Callback when exiting this state (no-op by default)
+
+    Per-state data lives in ScreenStateMachine (see get_state_data).
     """
     name: str
-    allowed_transitions: Set[str] = field(default_factory=set)
-    on_enter: Optional[Callable[['ScreenStateMachine', str], None]] = None
-    on_exit: Optional[Callable[['ScreenStateMachine', str], None]] = None
-    data: Dict[str, Any] = field(default_factory=dict)
+    allowed_transitions: Optional[FrozenSet[str]] = None
+    on_enter: Callable[['ScreenStateMachine', str], None] = _noop
+    on_exit: Callable[['ScreenStateMachine', str], None] = _noop
 
     def can_transition_to(self, target: str) -> bool:
         """Check if transition to target state is allowed."""
-        # Empty set means all transitions allowed
-        if not self.allowed_transitions:
-            return True
-        return target in self.allowed_transitions
+        # None means all transitions allowed
+        return self.allowed_transitions is None or target in self.allowed_transitions
 
 
 @dataclass
@@ -84,8 +90,12 @@ class ScreenStateMachine:
         self._states: Dict[str, ScreenState] = {}
         self._transitions: List[Transition] = []
         self._current_state: Optional[str] = None
-        self._history: List[str] = []
-        self._history_limit = 10
+        # Bounded history: oldest entries are evicted automatically
+        self._history: deque = deque(maxlen=10)
+
+        # Immutable snapshots for queries, rebuilt only after a mutation
+        self._history_snapshot: Optional[Tuple[str, ...]] = None
+        self._states_snapshot: Optional[Tuple[str, ...]] = None
 
         # State-specific data storage
         self._state_data: Dict[str, Dict[str, Any]] = {}
@@ -121,14 +131,16 @@ class ScreenStateMachine:
         Returns:
             Self for method chaining
         """
+        # Interned keys let dict lookups with the config constants hit on identity
+        name = sys.intern(name)
         self._states[name] = ScreenState(
             name=name,
-            allowed_transitions=allowed_transitions or set(),
-            on_enter=on_enter,
-            on_exit=on_exit,
-            data=data or {}
+            allowed_transitions=frozenset(allowed_transitions) if allowed_transitions else None,
+            on_enter=on_enter or _noop,
+            on_exit=on_exit or _noop
         )
-        self._state_data[name] = data.copy() if data else {}
+        self._state_data[name] = dict(data) if data else {}
+        self._states_snapshot = None
         return self
 
     def register_transition(
@@ -182,42 +194,52 @@ class ScreenStateMachine:
         Returns:
             TransitionResult indicating success or failure reason
         """
+        # Bind attributes read more than once to locals
+        states = self._states
+        old_state = self._current_state
+
         # Validate target state exists
-        if target_state not in self._states:
+        target = states.get(target_state)
+        if target is None:
             print(f"⚠️  Invalid state: {target_state}")
             return TransitionResult.INVALID_STATE
 
+        # Re-entering the current state is a refresh: merge data, skip callbacks
+        if target_state == old_state:
+            if kwargs:
+                self._state_data[target_state].update(kwargs)
+            return TransitionResult.SUCCESS
+
         # Get current state object (may be None on first transition)
-        current = self._states.get(self._current_state) if self._current_state else None
+        current = states.get(old_state) if old_state else None
 
         # Check if transition is allowed
         if current and not current.can_transition_to(target_state):
-            print(f"⚠️  Transition from {self._current_state} to {target_state} not allowed")
+            print(f"⚠️  Transition from {old_state} to {target_state} not allowed")
             return TransitionResult.BLOCKED
 
         # Check guard conditions for registered transitions
-        for transition in self._transitions:
-            if transition.from_state == self._current_state and \
+        transitions = self._transitions
+        for transition in transitions:
+            if transition.from_state == old_state and \
                transition.to_state == target_state:
                 if transition.guard and not transition.guard(self):
-                    print(f"⚠️  Guard failed for {self._current_state} -> {target_state}")
+                    print(f"⚠️  Guard failed for {old_state} -> {target_state}")
                     return TransitionResult.GUARD_FAILED
 
         # Execute transition
-        old_state = self._current_state
 
         # Exit current state
-        if current and current.on_exit:
+        if current:
             current.on_exit(self, target_state)
 
         # Add to history (for back navigation)
-        if old_state and old_state != target_state:
+        if old_state:
             self._history.append(old_state)
-            if len(self._history) > self._history_limit:
-                self._history.pop(0)
+            self._history_snapshot = None
 
         # Execute transition actions
-        for transition in self._transitions:
+        for transition in transitions:
             if transition.from_state == old_state and transition.to_state == target_state:
                 if transition.action:
                     transition.action(self)
@@ -230,13 +252,12 @@ class ScreenStateMachine:
             self._state_data[target_state].update(kwargs)
 
         # Enter new state
-        target = self._states[target_state]
-        if target.on_enter:
-            target.on_enter(self, old_state)
+        target.on_enter(self, old_state)
 
         # Global callback
-        if self._on_state_change:
-            self._on_state_change(old_state, target_state)
+        on_state_change = self._on_state_change
+        if on_state_change is not None:
+            on_state_change(old_state, target_state)
 
         return TransitionResult.SUCCESS
 
@@ -251,6 +272,7 @@ class ScreenStateMachine:
             return False
 
         previous_state = self._history.pop()
+        self._history_snapshot = None
         result = self.transition_to(previous_state)
         return result == TransitionResult.SUCCESS
 
@@ -264,6 +286,7 @@ class ScreenStateMachine:
         result = self.transition_to(config.ScreenState.HOME)
         # Clear history after going home (navigation is complete)
         self._history.clear()
+        self._history_snapshot = None
         return result == TransitionResult.SUCCESS
 
     # =========================================================================
@@ -305,14 +328,18 @@ class ScreenStateMachine:
         if state in self._state_data:
             self._state_data[state][key] = value
 
-    def get_history(self) -> List[str]:
-        """Get navigation history."""
-        return self._history.copy()
+    def get_history(self) -> Tuple[str, ...]:
+        """Get navigation history (shared snapshot, reused until navigation)."""
+        if self._history_snapshot is None:
+            self._history_snapshot = tuple(self._history)
+        return self._history_snapshot
 
     @property
-    def registered_states(self) -> List[str]:
-        """Get list of registered state names."""
-        return list(self._states.keys())
+    def registered_states(self) -> Tuple[str, ...]:
+        """Get registered state names (shared snapshot, reused until registration)."""
+        if self._states_snapshot is None:
+            self._states_snapshot = tuple(self._states)
+        return self._states_snapshot
 
 
 # =============================================================================
@@ -15,17 +15,40 @@ Implements the complete friend request protocol:
 5. Both devices are now friends
 """
 
+import os
 import time
 import json
-from typing import Optional, Callable, Dict, Any, List
+import threading
+from typing import Optional, Callable, Dict, Any, List, Tuple
 from . import config
-from .wifi_manager import WiFiManager
+from .wifi_manager import WiFiManager, encode_message
 from .friend_manager import FriendManager
 from .message_handlers import (
     MessageHandlerRegistry,
     MessageHandlerContext,
     create_default_registry
 )
+from .logging_config import get_logger
+
+# Module logger
+logger = get_logger(__name__)
+
+
+def _context_property(slot: str, doc: str) -> property:
+    """
+    Property stored in a slot that drops the cached handler context on set
+
+    Incoming messages reuse one MessageHandlerContext built from these
+    values, so replacing any of them must rebuild it.
+    """
+    def getter(self):
+        return getattr(self, slot)
+
+    def setter(self, value):
+        setattr(self, slot, value)
+        self._handler_context = None
+
+    return property(getter, setter, doc=doc)
 
 
 class SocialCoordinator:
@@ -35,6 +58,19 @@ class SocialCoordinator:
     This is the main interface for social features in NotaGotchi.
     """
 
+    # Fixed attribute set; slot access is cheaper in the per-message path
+    __slots__ = (
+        'wifi', 'friends', '_messages', '_own_pet_name', '_handler_context',
+        '_message_registry',
+        '_on_friend_request_received', '_on_friend_request_accepted',
+        '_on_friend_request_rejected', '_on_message_received',
+        '_game_callbacks',
+        '_fr_template_key', '_fr_prefix',
+        '_accept_template_key', '_accept_prefix',
+        '_discovery_snapshot', '_discovery_thread', '_discovery_save_lock',
+        '_discovery_saved',
+    )
+
     def __init__(self, wifi_manager: WiFiManager, friend_manager: FriendManager,
                  own_pet_name: str, message_manager=None,
                  message_registry: MessageHandlerRegistry = None):
@@ -50,9 +86,13 @@ class SocialCoordinator:
         """
         self.wifi = wifi_manager
         self.friends = friend_manager
-        self.own_pet_name = own_pet_name
         self.messages = message_manager  # Optional MessageManager
 
+        # Handler context shared by all incoming messages; rebuilt lazily
+        # after callbacks or the pet name change
+        self._handler_context: Optional[MessageHandlerContext] = None
+        self.own_pet_name = own_pet_name
+
         # Message handler registry (uses Strategy pattern)
         self._message_registry = message_registry or create_default_registry()
 
@@ -62,12 +102,50 @@ class SocialCoordinator:
         self.on_friend_request_rejected: Optional[Callable] = None
         self.on_message_received: Optional[Callable] = None
 
-        # Game callbacks (stored separately, attached to context on each message)
+        # Game callbacks (stored separately, attached to the handler context)
         self._game_callbacks: Dict[str, Callable] = {}
 
+        # Pre-encoded protocol message prefixes; only the per-send fields vary.
+        # Each is rebuilt when any of the identity fields in its key change.
+        self._fr_template_key: Optional[tuple] = None
+        self._fr_prefix: bytes = b""
+        self._accept_template_key: Optional[tuple] = None
+        self._accept_prefix: bytes = b""
+
+        # Last discovery scan as (wall time, devices), seeded from disk so
+        # the first discovery after boot can answer without scanning
+        self._discovery_snapshot: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        self._discovery_thread: Optional[threading.Thread] = None
+        self._discovery_save_lock = threading.Lock()  # Serializes cache writes
+
+        # Snapshot last written to disk; the file is rewritten only when the
+        # device set changes or the copy on disk is close to going stale
+        self._discovery_saved: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        self._load_discovery_cache()
+
         # Register WiFi callback
         self.wifi.register_callback(self._handle_incoming_message)
 
+    messages = _context_property('_messages', "MessageManager instance (optional).")
+    on_friend_request_received = _context_property(
+        '_on_friend_request_received', "UI callback for an incoming friend request.")
+    on_friend_request_accepted = _context_property(
+        '_on_friend_request_accepted', "UI callback for an accepted friend request.")
+    on_friend_request_rejected = _context_property(
+        '_on_friend_request_rejected', "UI callback for a rejected friend request.")
+    on_message_received = _context_property(
+        '_on_message_received', "UI callback for an incoming chat message.")
+
+    @property
+    def own_pet_name(self) -> str:
+        """This pet's name, used in outgoing messages and handler context."""
+        return self._own_pet_name
+
+    @own_pet_name.setter
+    def own_pet_name(self, name: str):
+        self._own_pet_name = name
+        self._handler_context = None
+
     @property
     def message_registry(self) -> MessageHandlerRegistry:
         """Get the message handler registry for registering custom handlers."""
@@ -124,36 +202,55 @@ class SocialCoordinator:
 
         # Check if already friends
         if self.friends.is_friend(target_name):
-            print(f"⚠️  Already friends with {target_name}")
+            logger.warning("⚠️  Already friends with %s", target_name)
             return False
 
         # Check if at friend limit
         if not self.friends.can_add_more_friends():
-            print(f"❌ Friend limit reached ({config.MAX_FRIENDS} friends)")
+            logger.warning("❌ Friend limit reached (%d friends)", config.MAX_FRIENDS)
             return False
 
-        # Build friend request message
-        message = {
-            "type": "friend_request",
-            "from_device_name": self.wifi.device_name,
-            "from_pet_name": self.own_pet_name,
-            "from_ip": self.wifi._get_local_ip(),
-            "from_port": self.wifi.port,
-            "timestamp": time.time()
-        }
-
-        print(f"Sending friend request to {target_name}...")
+        logger.debug("Sending friend request to %s...", target_name)
 
         # Send via WiFi
-        success = self.wifi.send_message(target_ip, target_port, message)
+        success = self.wifi.send_message_bytes(
+            target_ip, target_port, self._build_friend_request_bytes()
+        )
 
         if success:
-            print(f"✅ Friend request sent to {target_name}")
+            logger.info("✅ Friend request sent to %s", target_name)
         else:
-            print(f"❌ Failed to send friend request to {target_name}")
+            logger.warning("❌ Failed to send friend request to %s", target_name)
 
         return success
 
+    def _build_friend_request_bytes(self) -> bytes:
+        """
+        Build the serialized friend request message
+
+        The message shape is fixed, so everything except the timestamp is
+        encoded once and reused until our name, pet name, IP or port change.
+
+        Returns:
+            UTF-8 encoded JSON friend request
+        """
+        key = (self.wifi.device_name, self.own_pet_name,
+               self.wifi.get_local_ip(), self.wifi.port)
+
+        if key != self._fr_template_key:
+            template = encode_message({
+                "type": "friend_request",
+                "from_device_name": key[0],
+                "from_pet_name": key[1],
+                "from_ip": key[2],
+                "from_port": key[3]
+            })
+            # Drop the closing brace so the timestamp can be appended
+            self._fr_prefix = template[:-1] + b',"timestamp":'
+            self._fr_template_key = key
+
+        return self._fr_prefix + repr(time.time()).encode() + b"}"
+
     def accept_friend_request(self, from_device_name: str) -> bool:
         """
         Accept a pending friend request
@@ -175,31 +272,51 @@ class SocialCoordinator:
             return False
 
         # Send acceptance message back to requester
-        message = {
-            "type": "friend_request_accepted",
-            "from_device_name": self.wifi.device_name,
-            "from_pet_name": self.own_pet_name,
-            "accepted_device_name": from_device_name,
-            "timestamp": time.time()
-        }
-
-        success = self.wifi.send_message(
+        success = self.wifi.send_message_bytes(
             friend_info['ip'],
             friend_info['port'],
-            message
+            self._build_acceptance_bytes(from_device_name)
         )
 
         if success:
-            print(f"✅ Acceptance sent to {friend_info['pet_name']}")
+            logger.info("✅ Acceptance sent to %s", friend_info['pet_name'])
 
             # Notify UI
             if self.on_friend_request_accepted:
                 self.on_friend_request_accepted(friend_info)
         else:
-            print(f"⚠️  Friend added but couldn't send acceptance to {friend_info['pet_name']}")
+            logger.warning("⚠️  Friend added but couldn't send acceptance to %s",
+                           friend_info['pet_name'])
 
         return True
 
+    def _build_acceptance_bytes(self, accepted_device_name: str) -> bytes:
+        """
+        Build the serialized friend request acceptance message
+
+        Our device and pet names are encoded once; only the accepted
+        device name and timestamp are encoded per send.
+
+        Args:
+            accepted_device_name: Device name whose request we accepted
+
+        Returns:
+            UTF-8 encoded JSON acceptance message
+        """
+        key = (self.wifi.device_name, self.own_pet_name)
+
+        if key != self._accept_template_key:
+            template = encode_message({
+                "type": "friend_request_accepted",
+                "from_device_name": key[0],
+                "from_pet_name": key[1]
+            })
+            self._accept_prefix = template[:-1] + b',"accepted_device_name":'
+            self._accept_template_key = key
+
+        return (self._accept_prefix + encode_message(accepted_device_name)
+                + b',"timestamp":' + repr(time.time()).encode() + b"}")
+
     def reject_friend_request(self, from_device_name: str) -> bool:
         """
         Reject a pending friend request
@@ -228,10 +345,11 @@ class SocialCoordinator:
         Returns:
             List of discovered devices (not filtered by friendship, excludes self)
         """
-        all_devices = self.wifi.discover_devices()
+        all_devices = self._get_discovered_devices()
 
         # Filter out ourselves
-        return [d for d in all_devices if d['name'] != self.wifi.device_name]
+        own_name = self.wifi.device_name
+        return [d for d in all_devices if d['name'] != own_name]
 
     def discover_new_devices(self) -> list:
         """
@@ -242,15 +360,112 @@ class SocialCoordinator:
         Returns:
             List of discovered devices that aren't friends yet (excludes self)
         """
-        all_devices = self.wifi.discover_devices()
+        all_devices = self._get_discovered_devices()
 
-        # Filter out ourselves and devices that are already friends
-        new_devices = []
-        for device in all_devices:
-            if device['name'] != self.wifi.device_name and not self.friends.is_friend(device['name']):
-                new_devices.append(device)
+        # Fetch friend names once instead of querying per device
+        own_name = self.wifi.device_name
+        friend_names = self.friends.friend_name_set()
 
-        return new_devices
+        # Filter out ourselves and devices that are already friends
+        return [d for d in all_devices
+                if d['name'] != own_name and d['name'] not in friend_names]
+
+    def _get_discovered_devices(self) -> List[Dict[str, Any]]:
+        """
+        Get discovered devices, answering from the last scan when possible
+
+        A recent scan (from this run or persisted from the previous one) is
+        returned immediately and refreshed in the background; otherwise the
+        network is scanned now. Back-to-back scans are shared by
+        WiFiManager.discover_devices, so no refresh is started while the
+        snapshot is younger than its cache TTL.
+        """
+        snapshot = self._discovery_snapshot
+        if snapshot:
+            age = time.time() - snapshot[0]
+            if age < config.DISCOVERY_CACHE_MAX_AGE:
+                if age >= config.WIFI_DISCOVERY_CACHE_TTL:
+                    self._start_discovery_refresh()
+                return snapshot[1]
+
+        return self._refresh_discovery()
+
+    def _start_discovery_refresh(self):
+        """Rescan in a background thread unless a rescan is already running"""
+        thread = self._discovery_thread
+        if thread and thread.is_alive():
+            return
+
+        thread = threading.Thread(target=self._refresh_discovery,
+                                  name="discovery-refresh", daemon=True)
+        self._discovery_thread = thread
+        thread.start()
+
+    def _refresh_discovery(self) -> List[Dict[str, Any]]:
+        """Scan the network and remember (and persist) the results"""
+        devices = self.wifi.discover_devices()
+
+        # A foreground and a background refresh may finish together
+        with self._discovery_save_lock:
+            self._discovery_snapshot = (time.time(), devices)
+            if self._discovery_cache_outdated():
+                self._save_discovery_cache()
+        return devices
+
+    def _load_discovery_cache(self):
+        """Load the persisted discovery results, ignoring stale or bad files"""
+        try:
+            with open(config.DISCOVERY_CACHE_PATH, 'r') as f:
+                cached = json.load(f)
+            saved_at = float(cached['saved_at'])
+            devices = list(cached['devices'])
+
+            # Discovery consumers index these keys on every entry
+            for device in devices:
+                if not (isinstance(device, dict) and
+                        all(key in device for key in ('name', 'address', 'port'))):
+                    raise ValueError("malformed device entry: %r" % (device,))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable discovery cache: %s", e)
+            return
+
+        if time.time() - saved_at < config.DISCOVERY_CACHE_MAX_AGE:
+            self._discovery_snapshot = self._discovery_saved = (saved_at, devices)
+            logger.debug("Loaded %d cached device(s)", len(devices))
+
+    def _discovery_cache_outdated(self) -> bool:
+        """Check whether the persisted scan no longer matches the last one"""
+        saved = self._discovery_saved
+        if not saved:
+            return True
+
+        # Keep the file fresh enough to be used after a restart
+        snapshot_time, devices = self._discovery_snapshot
+        if snapshot_time - saved[0] >= config.DISCOVERY_CACHE_MAX_AGE / 2:
+            return True
+
+        # Scan order isn't stable, so compare by device name
+        return ({d['name']: d for d in devices} !=
+                {d['name']: d for d in saved[1]})
+
+    def _save_discovery_cache(self):
+        """Persist the last discovery results (atomically replaces the file)"""
+        snapshot = self._discovery_snapshot
+        if not snapshot:
+            return
+
+        path = config.DISCOVERY_CACHE_PATH
+        tmp_path = path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump({'saved_at': snapshot[0], 'devices': snapshot[1]}, f)
+            os.replace(tmp_path, path)
+            self._discovery_saved = snapshot
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Could not save discovery cache: %s", e)
 
     # ========================================================================
     # FRIEND MANAGEMENT
@@ -323,7 +538,9 @@ class SocialCoordinator:
             message_data: Parsed message dict
             sender_ip: IP address of sender
         """
-        context = self._create_handler_context()
+        context = self._handler_context
+        if context is None:
+            context = self._handler_context = self._create_handler_context()
         self._message_registry.handle_message(message_data, sender_ip, context)
 
     # ========================================================================
@@ -344,7 +561,7 @@ class SocialCoordinator:
             Message ID if queued, None if error
         """
         if not self.messages:
-            print("❌ MessageManager not initialized")
+            logger.error("❌ MessageManager not initialized")
             return None
 
         return self.messages.send_message(to_device_name, content, content_type)
@@ -429,12 +646,14 @@ class SocialCoordinator:
         if on_message:
             self.on_message_received = on_message
 
+        self._handler_context = None
+
     def register_game_callbacks(self, callbacks: Dict[str, Callable]) -> None:
         """
         Register callbacks for game events.
 
-        These callbacks are stored and attached to each MessageHandlerContext
-        when messages arrive, ensuring game handlers can trigger UI updates.
+        These callbacks are stored and attached to the MessageHandlerContext
+        used for incoming messages, ensuring game handlers can trigger UI updates.
 
         Args:
             callbacks: Dict mapping callback names to functions, e.g.:
@@ -445,3 +664,4 @@ class SocialCoordinator:
                 }
         """
         self._game_callbacks.update(callbacks)
+        self._handler_context = None
@@ -5,14 +5,33 @@ Handles loading, caching, and managing pet sprites from BMP files.
 """
 
 import os
-from typing import Optional, Dict
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Tuple
 from PIL import Image
 from . import config
+from .logging_config import get_logger
+
+# Module logger
+logger = get_logger(__name__)
+
+# BMP palette entries (B, G, R) for the two colors of a 1-bit sprite
+_BMP_BLACK = b'\x00\x00\x00'
+_BMP_WHITE = b'\xff\xff\xff'
+
+# Flips every bit; used when a BMP's palette lists white before black
+_INVERT_BITS = bytes(255 - i for i in range(256))
 
 
 class SpriteManager:
     """Manages loading and caching of pet sprites"""
 
+    __slots__ = (
+        'sprites_dir', '_sprite_cache', '_missing_sprites', '_cache_lock',
+        '_last_image',
+    )
+
     def __init__(self, sprites_dir: str = None):
         """
         Initialize sprite manager
@@ -21,10 +40,19 @@ class SpriteManager:
             sprites_dir: Path to sprites directory (uses config default if None)
         """
         self.sprites_dir = sprites_dir or config.SPRITES_DIR
-        self._sprite_cache: Dict[str, Image.Image] = {}
+        # Packed pixel data (SPRITE_FORMAT, SPRITE_SIZE) rather than Image
+        # objects: a 1-bit sprite packs to ~1.3KB vs ~10KB inside PIL
+        self._sprite_cache: Dict[str, bytes] = {}
         self._missing_sprites: set = set()
 
-        print(f"Sprite manager initialized: {self.sprites_dir}")
+        # Guards cache inserts; preload fills the cache from worker threads
+        self._cache_lock = threading.Lock()
+
+        # (filename, Image) last built by load_sprite. The pet shows one
+        # sprite at a time and every render asks for it again.
+        self._last_image: Tuple[Optional[str], Optional[Image.Image]] = (None, None)
+
+        logger.info("Sprite manager initialized: %s", self.sprites_dir)
 
     def load_sprite(self, filename: str) -> Optional[Image.Image]:
         """
@@ -36,47 +64,153 @@ class SpriteManager:
         Returns:
             PIL Image object, or None if not found
         """
+        last_filename, last_image = self._last_image
+        if filename == last_filename:
+            return last_image
+
+        data = self.get_sprite_bytes(filename)
+        if data is None:
+            return None
+
+        image = Image.frombytes(config.SPRITE_FORMAT, config.SPRITE_SIZE, data)
+        self._last_image = (filename, image)
+        return image
+
+    def get_sprite_bytes(self, filename: str) -> Optional[bytes]:
+        """
+        Load a sprite's packed pixel data from file, with caching
+
+        Pixel data is SPRITE_FORMAT at SPRITE_SIZE, as Image.tobytes()
+        would return it; load_sprite builds its images from this.
+
+        Args:
+            filename: Sprite filename (e.g., "happy.bmp")
+
+        Returns:
+            Packed pixel bytes, or None if not found
+        """
         # Check cache first
-        if filename in self._sprite_cache:
-            return self._sprite_cache[filename]
+        data = self._sprite_cache.get(filename)
+        if data is not None:
+            return data
 
         # Check if we already know it's missing
         if filename in self._missing_sprites:
             return None
 
-        # Try to load from disk
+        # Try to load from disk; a missing file surfaces from open()
         sprite_path = os.path.join(self.sprites_dir, filename)
 
-        if not os.path.exists(sprite_path):
-            print(f"Warning: Sprite not found: {filename}")
-            self._missing_sprites.add(filename)
-            return None
-
         try:
+            # Sprites authored at the right size and depth skip PIL entirely
+            if config.SPRITE_FORMAT == "1":
+                data = self._fast_load_1bit_bmp(sprite_path)
+                if data is not None:
+                    with self._cache_lock:
+                        self._sprite_cache[filename] = data
+                    logger.debug("Loaded sprite: %s", filename)
+                    return data
+
             image = Image.open(sprite_path)
 
             # Validate dimensions
             if image.size != config.SPRITE_SIZE:
-                print(f"Warning: Sprite {filename} has incorrect size {image.size}, "
-                      f"expected {config.SPRITE_SIZE}. Resizing...")
+                logger.warning("Sprite %s has incorrect size %s, expected %s. Resizing...",
+                               filename, image.size, config.SPRITE_SIZE)
                 image = image.resize(config.SPRITE_SIZE, Image.LANCZOS)
 
             # Convert to 1-bit if needed
             if image.mode != config.SPRITE_FORMAT:
-                print(f"Converting {filename} from {image.mode} to {config.SPRITE_FORMAT}")
+                logger.debug("Converting %s from %s to %s",
+                             filename, image.mode, config.SPRITE_FORMAT)
                 image = image.convert(config.SPRITE_FORMAT)
 
-            # Cache the loaded sprite
-            self._sprite_cache[filename] = image
+            # Cache the packed pixel data
+            data = image.tobytes()
+            with self._cache_lock:
+                self._sprite_cache[filename] = data
 
-            print(f"Loaded sprite: {filename}")
-            return image
+            logger.debug("Loaded sprite: %s", filename)
+            return data
+
+        except FileNotFoundError:
+            logger.warning("Sprite not found: %s", filename)
+            with self._cache_lock:
+                self._missing_sprites.add(filename)
+            return None
 
         except Exception as e:
-            print(f"Error loading sprite {filename}: {e}")
-            self._missing_sprites.add(filename)
+            logger.error("Error loading sprite %s: %s", filename, e)
+            with self._cache_lock:
+                self._missing_sprites.add(filename)
+            return None
+
+    def _fast_load_1bit_bmp(self, sprite_path: str) -> Optional[bytes]:
+        """
+        Read an uncompressed black & white 1-bit BMP of SPRITE_SIZE directly
+
+        Args:
+            sprite_path: Path to the BMP file
+
+        Returns:
+            Packed pixel bytes (same layout as a mode "1" Image.tobytes()),
+            or None if the file needs the general PIL path
+        """
+        with open(sprite_path, 'rb') as f:
+            data = f.read()
+
+        if len(data) < 62 or data[:2] != b'BM':
+            return None
+
+        (off_bits,) = struct.unpack_from('<I', data, 10)
+        header_size, width, height, _planes, bit_count, compression = \
+            struct.unpack_from('<IiiHHI', data, 14)
+
+        sprite_width, sprite_height = config.SPRITE_SIZE
+        if (header_size < 40 or bit_count != 1 or compression != 0 or
+                width != sprite_width or abs(height) != sprite_height):
+            return None
+
+        # Palette index bits map straight onto mode "1" (0=black, 1=white)
+        palette = 14 + header_size
+        colors = (data[palette:palette + 3], data[palette + 4:palette + 7])
+        if colors == (_BMP_BLACK, _BMP_WHITE):
+            invert = False
+        elif colors == (_BMP_WHITE, _BMP_BLACK):
+            invert = True
+        else:
+            return None
+
+        # BMP rows are padded to 4 bytes; PIL rows are padded to 1 byte
+        row_bytes = (width + 7) // 8
+        stride = (row_bytes + 3) & ~3
+        if len(data) < off_bits + stride * sprite_height:
             return None
 
+        # Slice rows as views so the only copy is the final join
+        with memoryview(data) as view:
+            rows = [view[start:start + row_bytes]
+                    for start in range(off_bits, off_bits + stride * sprite_height, stride)]
+
+            # Positive height means rows are stored bottom-up
+            if height > 0:
+                rows.reverse()
+
+            packed = b''.join(rows)
+        if invert:
+            packed = packed.translate(_INVERT_BITS)
+
+        # Bits past the last pixel of each row are padding; PIL leaves them
+        # clear, but the file may not (and inverting sets them)
+        pad_bits = -width % 8
+        if pad_bits:
+            mask = (0xFF << pad_bits) & 0xFF
+            packed = bytearray(packed)
+            packed[row_bytes - 1::row_bytes] = bytes(
+                byte & mask for byte in packed[row_bytes - 1::row_bytes])
+            packed = bytes(packed)
+        return packed
+
     def get_emotion_sprite(self, emotion: str) -> Optional[Image.Image]:
         """
         Get sprite for an emotion state
@@ -161,36 +295,44 @@ class SpriteManager:
                 draw.text((x, y), text, fill=0, font=font)
 
         except Exception as e:
-            print(f"Error creating placeholder: {e}")
+            logger.error("Error creating placeholder: %s", e)
 
         return image
 
     def preload_all_sprites(self):
         """Preload all configured sprites into cache"""
-        print("Preloading all sprites...")
-
-        # Load emotion sprites
-        for emotion, filename in config.EMOTION_SPRITES.items():
-            self.load_sprite(filename)
-
-        # Load stage sprites
-        for stage, filename in config.STAGE_SPRITES.items():
-            self.load_sprite(filename)
+        logger.debug("Preloading all sprites...")
+
+        # Emotion and stage sprites not already resolved, each file once
+        # even if both maps reference it
+        configured = set(config.EMOTION_SPRITES.values())
+        configured.update(config.STAGE_SPRITES.values())
+        to_load = [filename for filename in configured
+                   if filename not in self._sprite_cache
+                   and filename not in self._missing_sprites]
+
+        # Load in parallel so file I/O overlaps with decoding
+        if to_load:
+            workers = min(len(to_load), config.SPRITE_PRELOAD_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(self.get_sprite_bytes, to_load))
 
         loaded_count = len(self._sprite_cache)
         missing_count = len(self._missing_sprites)
         total_count = loaded_count + missing_count
 
-        print(f"Preload complete: {loaded_count}/{total_count} sprites loaded")
+        logger.info("Preload complete: %d/%d sprites loaded", loaded_count, total_count)
 
         if missing_count > 0:
-            print(f"Missing sprites: {', '.join(self._missing_sprites)}")
+            logger.warning("Missing sprites: %s", ', '.join(self._missing_sprites))
 
     def clear_cache(self):
         """Clear the sprite cache"""
-        self._sprite_cache.clear()
-        self._missing_sprites.clear()
-        print("Sprite cache cleared")
+        with self._cache_lock:
+            self._sprite_cache.clear()
+            self._missing_sprites.clear()
+        self._last_image = (None, None)
+        logger.debug("Sprite cache cleared")
 
     def get_cache_info(self) -> Dict[str, int]:
         """Get cache statistics"""
@@ -201,9 +343,10 @@ class SpriteManager:
 
     def list_available_sprites(self) -> list:
         """List all BMP files in sprites directory"""
-        if not os.path.exists(self.sprites_dir):
+        try:
+            with os.scandir(self.sprites_dir) as entries:
+                sprites = [entry.name for entry in entries
+                           if entry.name.endswith('.bmp')]
+        except FileNotFoundError:
             return []
-
-        sprites = [f for f in os.listdir(self.sprites_dir)
-                  if f.endswith('.bmp')]
         return sorted(sprites)
@@ -11,13 +11,71 @@ Based on proven test code (test_wifi_*.py)
 """
 
 import socket
+import selectors
+import sys
 import threading
 import queue
 import json
 import time
 import subprocess
-from typing import Dict, List, Callable, Optional, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Callable, Optional, Any, Set, Tuple
 from . import config
+from .logging_config import get_logger
+
+# Module logger
+logger = get_logger(__name__)
+
+# Optional C JSON encoder; stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Wire settings read on every message; config is fixed at runtime
+_ENCODING = config.MESSAGE_ENCODING
+_MAX_MESSAGE_SIZE = config.WIFI_MESSAGE_MAX_SIZE
+
+# Acknowledgment is {"status": "received", "timestamp": <float>}; only the
+# timestamp varies, so the rest is pre-encoded
+_ACK_PREFIX = b'{"status":"received","timestamp":'
+
+# avahi-browse -p output markers, compared against raw bytes fields
+_AVAHI_RESOLVED = b'='
+_AVAHI_IPV4 = b'IPv4'
+_LOOPBACK_ADDRESS = b'127.0.0.1'
+
+
+def encode_message(message_data: Any) -> bytes:
+    """
+    Serialize a message dictionary (or a single message value) to JSON bytes
+
+    Uses orjson when installed (encodes straight to UTF-8 bytes in C),
+    otherwise json.dumps().
+
+    Raises:
+        TypeError/ValueError: If the message is not JSON serializable
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(message_data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(message_data).encode(_ENCODING)
+
+
+def decode_message(data) -> Any:
+    """
+    Parse received JSON bytes (orjson when available)
+
+    Accepts any bytes-like object, including a memoryview of a receive buffer.
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON (orjson's
+            decode error is a subclass)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(str(data, _ENCODING))
 
 
 class WiFiManager:
@@ -47,21 +105,36 @@ class WiFiManager:
         self.server_thread = None
         self.running = False
 
+        # Reused worker threads for incoming connections (created per start)
+        self._handler_pool: Optional[ThreadPoolExecutor] = None
+
+        # Socket pair used by stop_server to wake the server loop
+        self._wake_reader: Optional[socket.socket] = None
+        self._wake_writer: Optional[socket.socket] = None
+
         # mDNS via avahi-publish-service
         self.avahi_publish_process = None
 
-        # Callbacks - now uses queue for thread safety
-        self.message_callbacks: List[Callable] = []
-        self.callback_lock = threading.Lock()
+        # Callbacks - now uses queue for thread safety. The tuple is replaced,
+        # never mutated, so readers use it without taking the lock.
+        self.message_callbacks: Tuple[Callable, ...] = ()
+        self.callback_lock = threading.Lock()  # Serializes register/unregister
 
         # Thread-safe callback queue for events from server thread
         # Events are tuples: (message_data: Dict, sender_ip: str)
         self.callback_queue: queue.Queue[Tuple[Dict, str]] = queue.Queue()
 
-        # Connection tracking
-        self.active_connections = []
+        # Accepted client sockets not yet closed; stop_server closes them
+        self.active_connections: Set[socket.socket] = set()
         self.connection_lock = threading.Lock()
 
+        # Last avahi scan as (monotonic time, devices); one scan at a time
+        self._discovery_cache: Tuple[float, Optional[List[Dict[str, Any]]]] = (0.0, None)
+        self._discovery_lock = threading.Lock()
+
+        # Resolved local IP and its monotonic expiry time
+        self._local_ip_cache: Tuple[Optional[str], float] = (None, 0.0)
+
     def start_server(self) -> bool:
         """
         Start background TCP server with mDNS advertising
@@ -70,30 +143,35 @@ class WiFiManager:
             True if started successfully, False otherwise
         """
         if self.running:
-            print("WiFi server already running")
+            logger.info("WiFi server already running")
             return True
 
         try:
-            # Get local IP
-            local_ip = self._get_local_ip()
+            # Get local IP (cached; reused by outgoing friend requests)
+            local_ip = self.get_local_ip()
             if not local_ip:
-                print("❌ Could not determine local IP address")
+                logger.error("❌ Could not determine local IP address")
                 return False
 
-            print(f"Starting WiFi server on {local_ip}:{self.port}")
+            logger.info("Starting WiFi server on %s:%s", local_ip, self.port)
 
             # Create TCP server socket
             self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self.server_socket.bind(('', self.port))
             self.server_socket.listen(5)
-            self.server_socket.settimeout(1.0)  # Allow periodic checks
+            self.server_socket.setblocking(False)  # Server loop waits in select()
 
             # Setup mDNS advertising
             if not self._setup_mdns(local_ip):
-                print("⚠️  mDNS setup failed, continuing without service advertisement")
+                logger.warning("⚠️  mDNS setup failed, continuing without service advertisement")
 
             # Start server thread
+            self._wake_reader, self._wake_writer = socket.socketpair()
+            self._handler_pool = ThreadPoolExecutor(
+                max_workers=config.WIFI_HANDLER_WORKERS,
+                thread_name_prefix="WiFiHandler"
+            )
             self.running = True
             self.server_thread = threading.Thread(
                 target=self._server_loop,
@@ -102,11 +180,11 @@ class WiFiManager:
             )
             self.server_thread.start()
 
-            print(f"✅ WiFi server started: {self.device_name}")
+            logger.info("✅ WiFi server started: %s", self.device_name)
             return True
 
         except Exception as e:
-            print(f"❌ Failed to start WiFi server: {e}")
+            logger.error("❌ Failed to start WiFi server: %s", e)
             self.running = False
             return False
 
@@ -115,9 +193,12 @@ class WiFiManager:
         if not self.running:
             return
 
-        print("Stopping WiFi server...")
+        logger.info("Stopping WiFi server...")
         self.running = False
 
+        # The network may change before the next start; resolve it again then
+        self.invalidate_local_ip()
+
         try:
             # Stop avahi-publish-service process
             if self.avahi_publish_process:
@@ -126,20 +207,49 @@ class WiFiManager:
                     self.avahi_publish_process.wait(timeout=2.0)
                 except subprocess.TimeoutExpired:
                     self.avahi_publish_process.kill()
-                print("mDNS advertising stopped")
+                logger.info("mDNS advertising stopped")
 
-            # Close server socket
-            if self.server_socket:
-                self.server_socket.close()
+            # Wake the server loop so it exits immediately
+            if self._wake_writer:
+                self._wake_writer.send(b"x")
 
             # Wait for thread to finish
             if self.server_thread and self.server_thread.is_alive():
                 self.server_thread.join(timeout=2.0)
 
-            print("✅ WiFi server stopped")
+            # Close server and wake-up sockets
+            if self.server_socket:
+                self.server_socket.close()
+            if self._wake_writer:
+                self._wake_writer.close()
+                self._wake_reader.close()
+                self._wake_writer = self._wake_reader = None
+
+            # Close open client connections so stalled handlers return now;
+            # shutdown() wakes a recv blocked in another thread, close() alone doesn't
+            with self.connection_lock:
+                connections = list(self.active_connections)
+                self.active_connections.clear()
+            for client_socket in connections:
+                try:
+                    client_socket.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                client_socket.close()
+
+            # Drop queued handlers (their sockets are closed above); pool
+            # threads are joined at interpreter exit, so none may linger
+            if self._handler_pool:
+                if sys.version_info >= (3, 9):
+                    self._handler_pool.shutdown(wait=False, cancel_futures=True)
+                else:
+                    self._handler_pool.shutdown(wait=False)
+                self._handler_pool = None
+
+            logger.info("✅ WiFi server stopped")
 
         except Exception as e:
-            print(f"⚠️  Error during WiFi server shutdown: {e}")
+            logger.warning("⚠️  Error during WiFi server shutdown: %s", e)
 
     def update_device_name(self, new_name: str):
         """
@@ -148,7 +258,7 @@ class WiFiManager:
         Args:
             new_name: New device name for mDNS advertising
         """
-        print(f"Updating WiFi device name to: {new_name}")
+        logger.info("Updating WiFi device name to: %s", new_name)
 
         # Stop current mDNS advertising
         if self.avahi_publish_process:
@@ -166,18 +276,41 @@ class WiFiManager:
         if self.running:
             self._setup_mdns()
 
-    def discover_devices(self, duration: float = None) -> List[Dict[str, Any]]:
+    def discover_devices(self, duration: float = None,
+                         max_age: float = None) -> List[Dict[str, Any]]:
         """
         Discover NotaGotchi devices on network via avahi
 
+        The friend status poller and the social screens both scan, so a
+        scan younger than max_age is shared instead of browsing again, and
+        concurrent callers wait for one in-flight scan. Failed scans are
+        not cached.
+
         Args:
             duration: Scan duration in seconds (default from config)
+            max_age: Seconds a previous scan may be reused (default from config)
 
         Returns:
             List of discovered devices with format:
             [{"name": "notagotchi_Buddy", "address": "192.168.0.100",
               "port": 5555, "properties": {...}}]
         """
+        max_age = max_age if max_age is not None else config.WIFI_DISCOVERY_CACHE_TTL
+
+        with self._discovery_lock:
+            scanned_at, devices = self._discovery_cache
+            if devices is not None and time.monotonic() - scanned_at < max_age:
+                return devices
+
+            devices = self._browse_devices(duration)
+            if devices is None:
+                return []
+
+            self._discovery_cache = (time.monotonic(), devices)
+            return devices
+
+    def _browse_devices(self, duration: float = None) -> Optional[List[Dict[str, Any]]]:
+        """Run one avahi-browse scan; returns None if the scan failed"""
         duration = duration or config.WIFI_DISCOVERY_TIMEOUT
 
         # Strip .local. suffix if present (avahi-browse works either way, but cleaner without)
@@ -195,10 +328,10 @@ class WiFiManager:
         ]
 
         try:
+            # Raw bytes: most lines are discarded, so only kept fields are decoded
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=duration
             )
 
@@ -206,51 +339,48 @@ class WiFiManager:
 
             # Parse avahi-browse output
             # Format: =;interface;protocol;name;type;domain;hostname;address;port;txt
-            for line in result.stdout.split('\n'):
-                if not line.startswith('='):
+            for line in result.stdout.split(b'\n'):
+                if line[:1] != _AVAHI_RESOLVED:
                     continue
 
-                parts = line.split(';')
+                parts = line.split(b';', 9)
                 if len(parts) < 10:
                     continue
 
-                interface = parts[1]
                 protocol = parts[2]  # IPv4 or IPv6
-                name = parts[3]
                 address = parts[7]
                 port = parts[8]
-                txt = parts[9] if len(parts) > 9 else ""
 
                 # Only process IPv4 for now, skip localhost/loopback
-                if address and port and protocol == 'IPv4' and address != '127.0.0.1':
+                if address and port and protocol == _AVAHI_IPV4 and address != _LOOPBACK_ADDRESS:
+                    name = parts[3].decode('utf-8', 'replace')
+                    txt = parts[9].decode('utf-8', 'replace')
                     device_info = {
                         'name': name,
-                        'address': address,
+                        'address': address.decode('ascii'),
                         'port': int(port),
-                        'interface': interface,
-                        'properties': {}
+                        'interface': parts[1].decode('utf-8', 'replace'),
+                        # Parse TXT records: "key=value" items, quotes stripped
+                        'properties': {
+                            k.strip('"'): v.strip('"')
+                            for k, sep, v in (item.partition('=') for item in txt.split())
+                            if sep
+                        }
                     }
 
-                    # Parse TXT records
-                    if txt:
-                        for item in txt.split():
-                            if '=' in item:
-                                k, v = item.split('=', 1)
-                                device_info['properties'][k.strip('"')] = v.strip('"')
-
                     devices[name] = device_info
 
             return list(devices.values())
 
         except subprocess.TimeoutExpired:
-            print(f"Discovery timeout after {duration} seconds")
-            return []
+            logger.warning("Discovery timeout after %s seconds", duration)
+            return None
         except FileNotFoundError:
-            print("❌ avahi-browse not found. Install with: sudo apt-get install avahi-utils")
-            return []
+            logger.error("❌ avahi-browse not found. Install with: sudo apt-get install avahi-utils")
+            return None
         except Exception as e:
-            print(f"❌ Discovery error: {e}")
-            return []
+            logger.error("❌ Discovery error: %s", e)
+            return None
 
     def send_message(self, target_ip: str, target_port: int,
                     message_data: Dict[str, Any]) -> bool:
@@ -267,16 +397,42 @@ class WiFiManager:
         """
         try:
             # Serialize message
-            message_json = json.dumps(message_data)
-            message_bytes = message_json.encode(config.MESSAGE_ENCODING)
+            message_bytes = encode_message(message_data)
+        except (TypeError, ValueError) as e:
+            logger.warning("❌ Send error: %s", e)
+            return False
 
-            # Check size
-            if len(message_bytes) > config.WIFI_MESSAGE_MAX_SIZE:
-                print(f"❌ Message too large: {len(message_bytes)} bytes")
-                return False
+        return self.send_message_bytes(target_ip, target_port, message_bytes)
+
+    def send_message_bytes(self, target_ip: str, target_port: int,
+                           message_bytes: bytes) -> bool:
+        """
+        Send an already-serialized JSON message with acknowledgment
+
+        Lets callers with fixed-shape messages pre-encode them once
+        instead of paying for dict-to-JSON on every send.
 
+        Protocol messages are a few hundred bytes; only long chat content
+        approaches WIFI_MESSAGE_MAX_SIZE, so encoding first and checking the
+        encoded length is cheaper than estimating beforehand.
+
+        Args:
+            target_ip: Target device IP address
+            target_port: Target device port
+            message_bytes: UTF-8 encoded JSON message
+
+        Returns:
+            True if message sent and acknowledged, False otherwise
+        """
+        size = len(message_bytes)
+        if size > _MAX_MESSAGE_SIZE:
+            logger.warning("❌ Message too large: %d bytes", size)
+            return False
+
+        try:
             # Connect to target
             client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             client_socket.settimeout(config.WIFI_CONNECTION_TIMEOUT)
             client_socket.connect((target_ip, target_port))
 
@@ -290,7 +446,7 @@ class WiFiManager:
             response_data = client_socket.recv(1024)
 
             if response_data:
-                response = json.loads(response_data.decode(config.MESSAGE_ENCODING))
+                response = decode_message(response_data)
                 if response.get('status') == 'received':
                     client_socket.close()
                     return True
@@ -299,13 +455,13 @@ class WiFiManager:
             return False
 
         except socket.timeout:
-            print(f"❌ Connection timeout to {target_ip}:{target_port}")
+            logger.warning("❌ Connection timeout to %s:%s", target_ip, target_port)
             return False
         except ConnectionRefusedError:
-            print(f"❌ Connection refused by {target_ip}:{target_port}")
+            logger.warning("❌ Connection refused by %s:%s", target_ip, target_port)
             return False
         except Exception as e:
-            print(f"❌ Send error: {e}")
+            logger.warning("❌ Send error: %s", e)
             return False
 
     def register_callback(self, callback: Callable[[Dict, str], None]):
@@ -318,13 +474,15 @@ class WiFiManager:
             callback: Function to call when message received
         """
         with self.callback_lock:
-            self.message_callbacks.append(callback)
+            self.message_callbacks = self.message_callbacks + (callback,)
 
     def unregister_callback(self, callback: Callable):
         """Remove a registered callback"""
         with self.callback_lock:
-            if callback in self.message_callbacks:
-                self.message_callbacks.remove(callback)
+            callbacks = self.message_callbacks
+            if callback in callbacks:
+                index = callbacks.index(callback)
+                self.message_callbacks = callbacks[:index] + callbacks[index + 1:]
 
     def is_device_reachable(self, ip: str, port: int = None) -> bool:
         """
@@ -348,6 +506,33 @@ class WiFiManager:
         except:
             return False
 
+    def get_local_ip(self, ttl: float = None) -> Optional[str]:
+        """
+        Get local WiFi IP address, reusing a recent lookup
+
+        Resolving the address opens a socket, so the result is cached
+        for ttl seconds. Failed lookups are not cached.
+
+        Args:
+            ttl: Seconds to reuse the cached address (default from config)
+
+        Returns:
+            Local IP address, or None if it could not be determined
+        """
+        ttl = ttl if ttl is not None else config.WIFI_LOCAL_IP_TTL
+        local_ip, expires_at = self._local_ip_cache
+        now = time.monotonic()
+
+        if local_ip is None or now >= expires_at:
+            local_ip = self._get_local_ip()
+            self._local_ip_cache = (local_ip, now + ttl)
+
+        return local_ip
+
+    def invalidate_local_ip(self):
+        """Forget the cached local IP so the next lookup re-resolves it"""
+        self._local_ip_cache = (None, 0.0)
+
     # Private methods
 
     def _get_local_ip(self) -> Optional[str]:
@@ -360,18 +545,19 @@ class WiFiManager:
             s.close()
             return local_ip
         except:
-            # Method 2: Try to get from wlan0
+            # Method 2: Try to get from wlan0 (JSON output from iproute2)
             try:
                 result = subprocess.run(
-                    ['ip', '-4', 'addr', 'show', 'wlan0'],
+                    ['ip', '-j', '-4', 'addr', 'show', 'wlan0'],
                     capture_output=True,
-                    text=True
+                    timeout=1.0
                 )
-                for line in result.stdout.split('\n'):
-                    if 'inet ' in line:
-                        ip = line.strip().split()[1].split('/')[0]
-                        return ip
-            except:
+                for interface in decode_message(result.stdout):
+                    for addr in interface.get('addr_info', ()):
+                        if addr.get('local'):
+                            return addr['local']
+            except (OSError, subprocess.SubprocessError, ValueError,
+                    TypeError, AttributeError):
                 pass
 
         return None
@@ -420,89 +606,100 @@ class WiFiManager:
             if self.avahi_publish_process.poll() is not None:
                 # Process terminated - read error output
                 _, stderr = self.avahi_publish_process.communicate()
-                print(f"❌ avahi-publish-service failed:")
-                if stderr:
-                    print(f"   Error: {stderr.decode()}")
+                logger.error("❌ avahi-publish-service failed: %s",
+                             stderr.decode(errors='replace').strip() if stderr else "no output")
                 return False
 
-            print(f"✅ mDNS advertising: {self.device_name}")
+            logger.info("✅ mDNS advertising: %s", self.device_name)
             return True
 
         except FileNotFoundError:
-            print("⚠️  avahi-publish-service not found. Install with: sudo apt-get install avahi-utils")
+            logger.warning("⚠️  avahi-publish-service not found. Install with: sudo apt-get install avahi-utils")
             return False
         except Exception as e:
-            print(f"⚠️  mDNS setup error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.warning("⚠️  mDNS setup error: %s", e, exc_info=True)
             return False
 
     def _server_loop(self):
         """Background server loop (runs in thread)"""
-        print("WiFi server thread started")
+        logger.debug("WiFi server thread started")
+        server_socket = self.server_socket
+        handler_pool = self._handler_pool
 
-        while self.running:
-            try:
-                # Accept connections with timeout
-                client_socket, client_address = self.server_socket.accept()
-
-                # Handle in separate thread
-                handler_thread = threading.Thread(
-                    target=self._handle_client,
-                    args=(client_socket, client_address),
-                    daemon=True
-                )
-                handler_thread.start()
+        # Sleep until a peer connects or stop_server writes to the wake socket
+        selector = selectors.DefaultSelector()
+        selector.register(server_socket, selectors.EVENT_READ)
+        selector.register(self._wake_reader, selectors.EVENT_READ)
 
-            except socket.timeout:
-                # Normal timeout, check if should continue
-                continue
-            except OSError:
-                # Socket closed
-                break
-            except Exception as e:
-                if self.running:
-                    print(f"Server error: {e}")
+        try:
+            while self.running:
+                try:
+                    for key, _ in selector.select():
+                        if key.fileobj is not server_socket:
+                            return  # Woken by stop_server
+
+                        client_socket, client_address = server_socket.accept()
+                        with self.connection_lock:
+                            self.active_connections.add(client_socket)
 
-        print("WiFi server thread stopped")
+                        # Handle on a pooled worker thread
+                        handler_pool.submit(self._handle_client,
+                                            client_socket, client_address)
+
+                except BlockingIOError:
+                    # Peer went away between select() and accept()
+                    continue
+                except OSError:
+                    # Socket closed
+                    break
+                except Exception as e:
+                    if self.running:
+                        logger.error("Server error: %s", e)
+        finally:
+            selector.close()
+            logger.debug("WiFi server thread stopped")
 
     def _handle_client(self, client_socket: socket.socket, client_address: tuple):
         """Handle incoming client connection"""
         sender_ip = client_address[0]
 
         try:
-            # Receive data
-            data = b""
-            while True:
-                chunk = client_socket.recv(1024)
-                if not chunk:
-                    break
-                data += chunk
-                if len(data) >= config.WIFI_MESSAGE_MAX_SIZE:
+            # Bound the wait on a peer that stalls (e.g. dropped off WiFi
+            # mid-send) so it can't hold a pool worker indefinitely
+            client_socket.settimeout(config.WIFI_CONNECTION_TIMEOUT)
+
+            # Send the small ack without waiting on Nagle's algorithm
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            # Receive data straight into one buffer (no per-chunk copies)
+            buffer = memoryview(bytearray(_MAX_MESSAGE_SIZE))
+            recv_into = client_socket.recv_into
+            received = 0
+            while received < _MAX_MESSAGE_SIZE:
+                count = recv_into(buffer[received:])
+                if not count:
                     break
+                received += count
 
-            if data:
+            if received:
                 # Parse message
-                message_str = data.decode(config.MESSAGE_ENCODING)
-                message_data = json.loads(message_str)
+                message_data = decode_message(buffer[:received])
 
                 # Send acknowledgment
-                response = {
-                    "status": "received",
-                    "timestamp": time.time()
-                }
-                client_socket.sendall(
-                    json.dumps(response).encode(config.MESSAGE_ENCODING)
-                )
+                client_socket.sendall(_ACK_PREFIX + repr(time.time()).encode() + b"}")
 
                 # Invoke callbacks
                 self._invoke_callbacks(message_data, sender_ip)
 
+        except socket.timeout:
+            logger.warning("❌ Timed out waiting for message from %s", sender_ip)
         except json.JSONDecodeError as e:
-            print(f"❌ Invalid JSON from {sender_ip}: {e}")
+            logger.warning("❌ Invalid JSON from %s: %s", sender_ip, e)
         except Exception as e:
-            print(f"❌ Client handler error: {e}")
+            logger.warning("❌ Client handler error: %s", e)
         finally:
+            with self.connection_lock:
+                self.active_connections.discard(client_socket)
             client_socket.close()
 
     def _invoke_callbacks(self, message_data: Dict, sender_ip: str):
@@ -511,7 +708,7 @@ class WiFiManager:
         try:
             self.callback_queue.put_nowait((message_data, sender_ip))
         except queue.Full:
-            print(f"⚠️  Callback queue full, dropping message from {sender_ip}")
+            logger.warning("⚠️  Callback queue full, dropping message from %s", sender_ip)
 
     def process_callback_queue(self) -> int:
         """
@@ -525,8 +722,11 @@ class WiFiManager:
         """
         processed = 0
 
-        with self.callback_lock:
-            callbacks = self.message_callbacks.copy()
+        # Called every frame; nothing to do when no message arrived
+        if self.callback_queue.empty():
+            return processed
+
+        callbacks = self.message_callbacks
 
         while True:
             try:
@@ -536,7 +736,7 @@ class WiFiManager:
                     try:
                         callback(message_data, sender_ip)
                     except Exception as e:
-                        print(f"❌ Callback error: {e}")
+                        logger.error("❌ Callback error: %s", e, exc_info=True)
 
                 processed += 1
 
@@ -111,38 +111,43 @@ def test_tired_emotion():
 
     # Create a pet with low energy but otherwise okay stats
     pet = Pet("TestPet", health=80, hunger=50, happiness=50, energy=25)
+    emotion = pet.get_emotion_state()
     print(f"Initial state: {pet}")
     print(f"Energy: {pet.energy}")
-    print(f"Emotion: {pet.get_emotion_state()}")
+    print(f"Emotion: {emotion}")
 
-    assert pet.get_emotion_state() == "tired", \
-        f"Pet with energy=25 should be tired, got {pet.get_emotion_state()}"
+    assert emotion == "tired", \
+        f"Pet with energy=25 should be tired, got {emotion}"
 
     # Test priority: tired should be lower priority than sick and hungry
     print("\nTesting emotion priority...")
 
     # Sick should override tired
     pet.health = 25
-    print(f"Health={pet.health}, Energy={pet.energy}, Emotion={pet.get_emotion_state()}")
-    assert pet.get_emotion_state() == "sick", "Sick should override tired"
+    emotion = pet.get_emotion_state()
+    print(f"Health={pet.health}, Energy={pet.energy}, Emotion={emotion}")
+    assert emotion == "sick", "Sick should override tired"
 
     # Hungry should override tired
     pet.health = 80
     pet.hunger = 75
-    print(f"Hunger={pet.hunger}, Energy={pet.energy}, Emotion={pet.get_emotion_state()}")
-    assert pet.get_emotion_state() == "hungry", "Hungry should override tired"
+    emotion = pet.get_emotion_state()
+    print(f"Hunger={pet.hunger}, Energy={pet.energy}, Emotion={emotion}")
+    assert emotion == "hungry", "Hungry should override tired"
 
     # Tired should override sad
     pet.hunger = 50
     pet.happiness = 25
-    print(f"Happiness={pet.happiness}, Energy={pet.energy}, Emotion={pet.get_emotion_state()}")
-    assert pet.get_emotion_state() == "tired", "Tired should override sad"
+    emotion = pet.get_emotion_state()
+    print(f"Happiness={pet.happiness}, Energy={pet.energy}, Emotion={emotion}")
+    assert emotion == "tired", "Tired should override sad"
 
     # High energy should not be tired
     pet.energy = 80
     pet.happiness = 50
-    print(f"\nEnergy={pet.energy}, Emotion={pet.get_emotion_state()}")
-    assert pet.get_emotion_state() != "tired", \
+    emotion = pet.get_emotion_state()
+    print(f"\nEnergy={pet.energy}, Emotion={emotion}")
+    assert emotion != "tired", \
         "Pet with high energy should not be tired"
 
     print("\n✓ PASS: Tired emotion triggers correctly")
@@ -156,10 +161,11 @@ def test_sleep_restores_energy():
 
     # Create a tired pet
     pet = Pet("TestPet", health=80, hunger=50, happiness=50, energy=20)
+    emotion = pet.get_emotion_state()
     print(f"Initial state: {pet}")
     print(f"Initial energy: {pet.energy}")
-    print(f"Initial emotion: {pet.get_emotion_state()}")
-    assert pet.get_emotion_state() == "tired", "Pet should be tired"
+    print(f"Initial emotion: {emotion}")
+    assert emotion == "tired", "Pet should be tired"
 
     # Sleep action
     print("\nPutting pet to sleep...")
@@ -170,10 +176,11 @@ def test_sleep_restores_energy():
     # Wait for sleep timer to expire
     print("\nWaiting for sleep timer to expire...")
     pet.tick_sleep_timer(config.SLEEP_DISPLAY_DURATION + 1)
-    print(f"Emotion after sleep expires: {pet.get_emotion_state()}")
+    emotion = pet.get_emotion_state()
+    print(f"Emotion after sleep expires: {emotion}")
 
     assert pet.energy >= 70, f"Energy should be restored, got {pet.energy}"
-    assert pet.get_emotion_state() != "tired", \
+    assert emotion != "tired", \
         "Pet should no longer be tired after sleeping"
 
     print("\n✓ PASS: Sleep restores energy and resolves tired state")
@@ -15,18 +15,29 @@ Usage:
     # Send single message
     python3 test_wifi_client.py <target_device_name> <message>
 
+    # Send single message to a known address (skips discovery)
+    python3 test_wifi_client.py <ip_address>[:port] <message>
+
 Example:
     python3 test_wifi_client.py NotaGotchi_TestA "Hello from TestB!"
+    python3 test_wifi_client.py 192.168.1.42:5555 "Hello from TestB!"
 """
 
+import ipaddress
 import socket
 import json
 import time
 import sys
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 import test_wifi_config as config
 from test_wifi_discovery_avahi import discover_via_avahi as discover_devices
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 def send_message(
     target_address: str,
@@ -67,9 +78,11 @@ def send_message(
             "timestamp": time.time()
         }
 
-        # Serialize to JSON
-        message_json = json.dumps(message)
-        message_bytes = message_json.encode(config.MESSAGE_ENCODING)
+        # Serialize to JSON (orjson emits UTF-8 bytes directly)
+        if ORJSON_AVAILABLE:
+            message_bytes = orjson.dumps(message)
+        else:
+            message_bytes = json.dumps(message).encode(config.MESSAGE_ENCODING)
 
         print(f"📦 Message size: {len(message_bytes)} bytes")
 
@@ -97,7 +110,10 @@ def send_message(
         response_data = client_socket.recv(1024)
 
         if response_data:
-            response = json.loads(response_data.decode(config.MESSAGE_ENCODING))
+            if ORJSON_AVAILABLE:
+                response = orjson.loads(response_data)
+            else:
+                response = json.loads(response_data.decode(config.MESSAGE_ENCODING))
             if response.get("status") == "received":
                 print(f"✅ Message delivered successfully!")
                 print(f"   Server acknowledged at: {time.strftime('%H:%M:%S', time.localtime(response.get('timestamp', 0)))}")
@@ -196,15 +212,42 @@ def interactive_mode():
         print("\n\nCancelled by user")
 
 
+def parse_target_address(target: str) -> Optional[Tuple[str, int]]:
+    """
+    Parse an "ip" or "ip:port" target
+
+    Args:
+        target: Device name or IPv4 address, optionally with a port
+
+    Returns:
+        (address, port) tuple, or None if target is not an address
+    """
+    address, _, port = target.partition(':')
+    try:
+        ipaddress.IPv4Address(address)
+        return address, int(port) if port else config.DEFAULT_PORT
+    except ValueError:
+        return None
+
+
 def single_message_mode(target_name: str, message: str, from_name: str = None):
     """Send a single message to a specific device"""
     print(f"\n{'='*60}")
     print(f"NotaGotchi Wi-Fi Client - Single Message Mode")
     print(f"{'='*60}\n")
 
+    # Set default from name
+    if from_name is None:
+        from_name = config.TEST_DEVICE_B_NAME
+
+    # Known address: connect directly, no discovery scan
+    target_address = parse_target_address(target_name)
+    if target_address:
+        return send_message(target_address[0], target_address[1], from_name, message)
+
     # Discover devices
     print(f"Looking for '{target_name}'...")
-    devices = discover_devices()
+    devices = discover_devices(target_name=target_name)
 
     # Find target device
     target_device = None
@@ -220,10 +263,6 @@ def single_message_mode(target_name: str, message: str, from_name: str = None):
             print(f"  - {device['name']}")
         return False
 
-    # Set default from name
-    if from_name is None:
-        from_name = config.TEST_DEVICE_B_NAME
-
     # Send message
     success = send_message(
         target_device['address'],
@@ -30,6 +30,7 @@ DISCOVERY_DURATION_SECONDS = 5.0
 # Message settings
 MAX_MESSAGE_SIZE = 8192  # 8KB max message size
 MESSAGE_ENCODING = "utf-8"
+RECEIVED_MESSAGE_HISTORY = 100  # Most recent messages kept by the test server
 
 # ============================================================================
 # TEST CONFIGURATION
@@ -8,16 +8,19 @@ avoiding port conflicts.
 
 import subprocess
 import json
+import threading
 import time
 import sys
-from typing import Dict, List
+from typing import Dict, List, Optional
 
-def discover_via_avahi(duration_seconds: float = 5.0) -> List[Dict]:
+def discover_via_avahi(duration_seconds: float = 5.0,
+                       target_name: Optional[str] = None) -> List[Dict]:
     """
     Discover NotaGotchi devices using avahi-browse command
 
     Args:
         duration_seconds: How long to scan
+        target_name: Stop scanning as soon as this device is resolved
 
     Returns:
         List of discovered devices
@@ -38,19 +41,30 @@ def discover_via_avahi(duration_seconds: float = 5.0) -> List[Dict]:
     ]
 
     try:
-        # Run with timeout
-        result = subprocess.run(
+        # Stream output so we can stop as soon as the target shows up
+        process = subprocess.Popen(
             cmd,
-            capture_output=True,
-            text=True,
-            timeout=duration_seconds
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
         )
 
+        # Kill the scan at the deadline; the read loop then sees EOF
+        timed_out = threading.Event()
+
+        def _on_timeout():
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(duration_seconds, _on_timeout)
+        timer.start()
+
         devices = {}
 
         # Parse avahi-browse output
         # Format: =;interface;protocol;name;type;domain;hostname;address;port;txt
-        for line in result.stdout.split('\n'):
+        for line in process.stdout:
+            line = line.rstrip('\n')
             if not line.startswith('='):
                 continue
 
@@ -93,11 +107,20 @@ def discover_via_avahi(duration_seconds: float = 5.0) -> List[Dict]:
                     print(f"   Properties: {device_info['properties']}")
                 print()
 
-        return list(devices.values())
+                if name == target_name:
+                    process.kill()
+                    break
 
-    except subprocess.TimeoutExpired:
-        print(f"Scan timeout after {duration_seconds} seconds")
-        return []
+        timer.cancel()
+        process.stdout.close()
+        process.wait()
+
+        # The deadline may pass just after the target was found
+        if timed_out.is_set() and target_name not in devices:
+            print(f"Scan timeout after {duration_seconds} seconds")
+            return []
+
+        return list(devices.values())
     except FileNotFoundError:
         print(f"❌ ERROR: avahi-browse not found")
         print(f"Install with: sudo apt-get install avahi-utils")
@@ -20,9 +20,16 @@ import threading
 import json
 import time
 import sys
-from typing import Dict, Any, List
+from collections import deque
+from typing import Dict, Any, Deque
 import test_wifi_config as config
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     from zeroconf import Zeroconf, ServiceInfo
 except ImportError:
@@ -38,7 +45,10 @@ class NotaGotchiServer:
         self.device_name = device_name
         self.port = port
         self.running = False
-        self.received_messages: List[Dict[str, Any]] = []
+        # Bounded so a long-running server doesn't grow without limit
+        self.received_messages: Deque[Dict[str, Any]] = deque(
+            maxlen=config.RECEIVED_MESSAGE_HISTORY)
+        self.messages_received_count = 0
 
         # Device info
         self.device_info = {
@@ -165,9 +175,11 @@ class NotaGotchiServer:
                     break
 
             if data:
-                # Parse message
-                message_str = data.decode(config.MESSAGE_ENCODING)
-                message_data = json.loads(message_str)
+                # Parse message (orjson's decode error subclasses JSONDecodeError)
+                if ORJSON_AVAILABLE:
+                    message_data = orjson.loads(data)
+                else:
+                    message_data = json.loads(data.decode(config.MESSAGE_ENCODING))
 
                 print(f"\n📨 Received message:")
                 print(f"  From: {message_data.get('from_device_name', 'Unknown')}")
@@ -183,14 +195,18 @@ class NotaGotchiServer:
                     "from_address": client_address[0]
                 })
 
-                print(f"  Total messages received: {len(self.received_messages)}\n")
+                self.messages_received_count += 1
+                print(f"  Total messages received: {self.messages_received_count}\n")
 
                 # Send acknowledgment
                 response = {
                     "status": "received",
                     "timestamp": time.time()
                 }
-                client_socket.sendall(json.dumps(response).encode(config.MESSAGE_ENCODING))
+                if ORJSON_AVAILABLE:
+                    client_socket.sendall(orjson.dumps(response))
+                else:
+                    client_socket.sendall(json.dumps(response).encode(config.MESSAGE_ENCODING))
 
         except json.JSONDecodeError as e:
             print(f"❌ Error decoding message JSON: {e}")
@@ -231,10 +247,10 @@ class NotaGotchiServer:
 
             print("✅ Server stopped cleanly")
 
-            if self.received_messages:
+            if self.messages_received_count:
                 print(f"\nServer Statistics:")
                 print(f"  Device Name: {self.device_name}")
-                print(f"  Messages Received: {len(self.received_messages)}")
+                print(f"  Messages Received: {self.messages_received_count}")
 
         except Exception as e:
             print(f"⚠️  Error during cleanup: {e}")
@@ -190,6 +190,30 @@ class TestMessageHandlerIntegration:
         result = registry.handle_message(unknown_msg, '192.168.1.1', context)
         assert result is False  # Gracefully handled
 
+    def test_handlers_registered_later_are_dispatched(self):
+        """Handlers added or removed after startup take effect immediately."""
+        registry = create_default_registry()
+        context = MessageHandlerContext(
+            friend_manager=None,
+            message_manager=None,
+            wifi_manager=None,
+            own_pet_name="MyPet"
+        )
+
+        class PingHandler(FriendRequestHandler):
+            @property
+            def message_type(self):
+                return 'ping'
+
+            def handle(self, message_data, sender_ip, context):
+                return True
+
+        registry.register(PingHandler())
+        assert registry.handle_message({'type': 'ping'}, '192.168.1.1', context) is True
+
+        registry.unregister('ping')
+        assert registry.handle_message({'type': 'ping'}, '192.168.1.1', context) is False
+
 
 class TestScreenStateMachineIntegration:
     """Tests screen navigation workflow."""
@@ -250,6 +274,31 @@ class TestScreenStateMachineIntegration:
         assert len(sm.get_history()) == 0
         assert sm.current_state == config.ScreenState.HOME
 
+    def test_history_is_bounded(self):
+        """Navigation history keeps only the most recent entries."""
+        sm = create_default_state_machine()
+
+        for _ in range(10):
+            sm.transition_to(config.ScreenState.MENU)
+            sm.transition_to(config.ScreenState.CARE_MENU)
+
+        history = sm.get_history()
+        assert len(history) == 10
+        assert history[-1] == config.ScreenState.MENU
+
+    def test_transition_to_current_state_is_refresh(self):
+        """Transitioning to the current state merges data without callbacks."""
+        entered = []
+        sm = ScreenStateMachine(initial_state='a')
+        sm.register_state('a', on_enter=lambda machine, prev: entered.append(prev))
+
+        result = sm.transition_to('a', selected_index=3)
+
+        assert result == TransitionResult.SUCCESS
+        assert entered == []
+        assert sm.get_state_data('a')['selected_index'] == 3
+        assert len(sm.get_history()) == 0
+
     def test_state_data_persistence(self):
         """State-specific data persists across navigation."""
         sm = create_default_state_machine()
@@ -268,6 +317,19 @@ class TestScreenStateMachineIntegration:
         data = sm.get_state_data(config.ScreenState.MENU)
         assert data.get('selected_index') == 2
 
+    def test_allowed_transitions_restrict_navigation(self):
+        """States with allowed_transitions block other targets."""
+        sm = ScreenStateMachine(initial_state='a')
+        sm.register_state('a', allowed_transitions={'b'})
+        sm.register_state('b')
+        sm.register_state('c')
+
+        assert sm.transition_to('c') == TransitionResult.BLOCKED
+        assert sm.transition_to('b') == TransitionResult.SUCCESS
+
+        # Unrestricted state can go anywhere
+        assert sm.transition_to('c') == TransitionResult.SUCCESS
+
 
 class TestMetricsIntegration:
     """Tests performance metrics collection."""
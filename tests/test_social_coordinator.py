@@ -0,0 +1,190 @@
+"""
+Unit Tests for NotaGotchi Social Coordinator
+
+Uses an unstarted WiFiManager with network calls replaced per test.
+"""
+
+import sys
+import os
+import json
+import sqlite3
+import time
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# These tests rely on pytest fixtures (monkeypatch, tmp_path)
+import pytest
+
+from modules import config
+from modules import wifi_manager
+from modules.wifi_manager import WiFiManager
+from modules.friend_manager import FriendManager
+from modules.social_coordinator import SocialCoordinator
+from modules.message_handlers import MessageHandler
+
+
+DEVICE_A = {'name': 'notagotchi_A', 'address': '10.0.0.2', 'port': 5555, 'properties': {}}
+DEVICE_B = {'name': 'notagotchi_B', 'address': '10.0.0.3', 'port': 5555, 'properties': {}}
+
+
+def _make_coordinator(monkeypatch, tmp_path, pet_name: str = "Buddy") -> SocialCoordinator:
+    """Create a coordinator with its discovery cache under tmp_path"""
+    monkeypatch.setattr(config, "DISCOVERY_CACHE_PATH", str(tmp_path / "discovery_cache.json"))
+    wifi = WiFiManager("notagotchi_Buddy")
+    friends = FriendManager(sqlite3.connect(":memory:"), "notagotchi_Buddy")
+    return SocialCoordinator(wifi, friends, pet_name)
+
+
+class TestProtocolMessageBuilders:
+    """Tests that the pre-encoded message templates produce valid JSON"""
+
+    @pytest.fixture(params=[True, False], ids=["orjson", "json"])
+    def encoder(self, request, monkeypatch):
+        """Run each test with orjson (if installed) and with stdlib json"""
+        if request.param and not wifi_manager.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(wifi_manager, "ORJSON_AVAILABLE", request.param)
+
+    def test_friend_request_parses(self, encoder, monkeypatch, tmp_path):
+        """Quotes and non-ASCII names survive the spliced template"""
+        coordinator = _make_coordinator(monkeypatch, tmp_path, pet_name='Zoë "Z" \\ 🐱')
+        coordinator.wifi.device_name = 'notagotchi_Zoë "Z"'
+        monkeypatch.setattr(coordinator.wifi, "get_local_ip", lambda ttl=None: "10.0.0.2")
+
+        message = json.loads(coordinator._build_friend_request_bytes())
+
+        assert message['type'] == 'friend_request'
+        assert message['from_device_name'] == 'notagotchi_Zoë "Z"'
+        assert message['from_pet_name'] == 'Zoë "Z" \\ 🐱'
+        assert message['from_ip'] == '10.0.0.2'
+        assert message['from_port'] == coordinator.wifi.port
+        assert isinstance(message['timestamp'], float)
+
+    def test_friend_request_follows_ip_change(self, encoder, monkeypatch, tmp_path):
+        """A new local IP rebuilds the template"""
+        coordinator = _make_coordinator(monkeypatch, tmp_path)
+        local_ip = ["10.0.0.2"]
+        monkeypatch.setattr(coordinator.wifi, "get_local_ip", lambda ttl=None: local_ip[0])
+
+        first = json.loads(coordinator._build_friend_request_bytes())
+        local_ip[0] = "192.168.1.7"
+        second = json.loads(coordinator._build_friend_request_bytes())
+
+        assert first['from_ip'] == "10.0.0.2"
+        assert second['from_ip'] == "192.168.1.7"
+
+    def test_acceptance_parses(self, encoder, monkeypatch, tmp_path):
+        """Quotes and non-ASCII names survive the spliced template"""
+        coordinator = _make_coordinator(monkeypatch, tmp_path, pet_name='Zoë "Z" 🐱')
+
+        message = json.loads(coordinator._build_acceptance_bytes('notagotchi_"Ünï"'))
+
+        assert message['type'] == 'friend_request_accepted'
+        assert message['from_device_name'] == 'notagotchi_Buddy'
+        assert message['from_pet_name'] == 'Zoë "Z" 🐱'
+        assert message['accepted_device_name'] == 'notagotchi_"Ünï"'
+        assert isinstance(message['timestamp'], float)
+
+    def test_acceptance_follows_pet_rename(self, encoder, monkeypatch, tmp_path):
+        """Renaming the pet rebuilds the template"""
+        coordinator = _make_coordinator(monkeypatch, tmp_path)
+        coordinator._build_acceptance_bytes('notagotchi_A')
+
+        coordinator.own_pet_name = 'Renamed'
+        message = json.loads(coordinator._build_acceptance_bytes('notagotchi_A'))
+
+        assert message['from_pet_name'] == 'Renamed'
+
+
+class NotifyHandler(MessageHandler):
+    """Test handler that forwards every message to on_message_received"""
+
+    @property
+    def message_type(self) -> str:
+        return 'notify'
+
+    def handle(self, message_data, sender_ip, context) -> bool:
+        context.on_message_received(message_data, sender_ip)
+        return True
+
+
+class TestHandlerContextRefresh:
+    """Tests that the cached handler context follows attribute changes"""
+
+    def test_assigned_callback_used_for_next_message(self, monkeypatch, tmp_path):
+        """Assigning on_message_received directly takes effect immediately"""
+        coordinator = _make_coordinator(monkeypatch, tmp_path)
+        coordinator.register_message_handler(NotifyHandler())
+        first, second = [], []
+
+        coordinator.on_message_received = lambda data, ip: first.append(ip)
+        coordinator._handle_incoming_message({'type': 'notify'}, '10.0.0.2')
+
+        coordinator.on_message_received = lambda data, ip: second.append(ip)
+        coordinator._handle_incoming_message({'type': 'notify'}, '10.0.0.3')
+
+        assert first == ['10.0.0.2']
+        assert second == ['10.0.0.3']
+
+    def test_assigned_message_manager_used_for_next_message(self, monkeypatch, tmp_path):
+        """Assigning messages directly replaces the manager handlers see"""
+        coordinator = _make_coordinator(monkeypatch, tmp_path)
+        coordinator._handle_incoming_message({'type': 'unknown'}, '10.0.0.2')
+
+        manager = object()
+        coordinator.messages = manager
+
+        assert coordinator._handler_context is None
+        assert coordinator.get_handler_context().messages is manager
+
+
+class TestDiscoveryCachePersistence:
+    """Tests for when discovery results are written to disk"""
+
+    def test_unchanged_scan_does_not_rewrite_cache(self, monkeypatch, tmp_path):
+        """Only a changed device set is written back to disk"""
+        coordinator = _make_coordinator(monkeypatch, tmp_path)
+        cache_path = config.DISCOVERY_CACHE_PATH
+        scans = [[DEVICE_A, DEVICE_B], [DEVICE_B, DEVICE_A], [DEVICE_A]]
+        monkeypatch.setattr(coordinator.wifi, "discover_devices", lambda: scans.pop(0))
+
+        coordinator._refresh_discovery()
+        assert os.path.exists(cache_path)
+        os.remove(cache_path)
+
+        # Same devices in a different order
+        coordinator._refresh_discovery()
+        assert not os.path.exists(cache_path)
+
+        # A device went away
+        coordinator._refresh_discovery()
+        assert os.path.exists(cache_path)
+
+    def test_saved_cache_seeds_next_start(self, monkeypatch, tmp_path):
+        """A new coordinator answers from the persisted scan without scanning"""
+        coordinator = _make_coordinator(monkeypatch, tmp_path)
+        monkeypatch.setattr(coordinator.wifi, "discover_devices", lambda: [DEVICE_A])
+        coordinator._refresh_discovery()
+
+        restarted = _make_coordinator(monkeypatch, tmp_path)
+        monkeypatch.setattr(restarted.wifi, "discover_devices", lambda: [])
+        assert restarted.discover_nearby_devices() == [DEVICE_A]
+
+    @pytest.mark.parametrize("devices", [
+        [{'address': '10.0.0.2', 'port': 5555}],
+        [DEVICE_A, "notagotchi_B"],
+        {'notagotchi_A': DEVICE_A},
+    ], ids=["missing_name", "not_a_dict", "not_a_list"])
+    def test_malformed_cache_is_ignored(self, monkeypatch, tmp_path, devices):
+        """A cache file with bad device entries is discarded on load"""
+        (tmp_path / "discovery_cache.json").write_text(
+            json.dumps({'saved_at': time.time(), 'devices': devices}))
+        coordinator = _make_coordinator(monkeypatch, tmp_path)
+        monkeypatch.setattr(coordinator.wifi, "discover_devices", lambda: [DEVICE_B])
+
+        assert coordinator.discover_new_devices() == [DEVICE_B]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,192 @@
+"""
+Unit Tests for NotaGotchi Sprite Manager
+
+Writes BMP files with PIL into a temporary sprites directory and checks
+the loaded pixel data against PIL's own decoding.
+"""
+
+import sys
+import os
+import io
+import random
+import struct
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# These tests rely on pytest fixtures (tmp_path)
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from modules import config
+from modules.sprite_manager import SpriteManager
+
+
+def _random_sprite(size=config.SPRITE_SIZE, seed: int = 1) -> "Image.Image":
+    """Create a 1-bit image with a reproducible random pattern"""
+    rng = random.Random(seed)
+    row_bytes = (size[0] + 7) // 8
+    data = bytes(rng.getrandbits(8) for _ in range(row_bytes * size[1]))
+    return Image.frombytes("1", size, data)
+
+
+def _write_1bit_bmp(path, image, white_first: bool = False, top_down: bool = False):
+    """
+    Save a 1-bit image as BMP, optionally rewritten as a variant PIL won't emit
+
+    Args:
+        path: Output file path
+        image: Mode "1" image
+        white_first: Swap the palette to (white, black) and invert the pixel
+            bits, leaving row padding bits clear as other writers do
+        top_down: Store rows top-down (negative height)
+    """
+    buffer = io.BytesIO()
+    image.save(buffer, "BMP")
+    data = bytearray(buffer.getvalue())
+
+    (off_bits,) = struct.unpack_from('<I', data, 10)
+    (header_size,) = struct.unpack_from('<I', data, 14)
+    width, height = struct.unpack_from('<ii', data, 18)
+    row_bytes = (width + 7) // 8
+    stride = (row_bytes + 3) & ~3
+    rows = [bytearray(data[start:start + stride])
+            for start in range(off_bits, off_bits + stride * height, stride)]
+
+    if white_first:
+        palette = 14 + header_size
+        data[palette:palette + 8] = data[palette + 4:palette + 8] + data[palette:palette + 4]
+        pad_mask = (0xFF << (-width % 8)) & 0xFF
+        for row in rows:
+            for i in range(row_bytes):
+                row[i] ^= 0xFF
+            row[row_bytes - 1] &= pad_mask
+
+    if top_down:
+        rows.reverse()
+        struct.pack_into('<i', data, 22, -height)
+
+    data[off_bits:off_bits + stride * height] = b''.join(rows)
+    with open(path, 'wb') as f:
+        f.write(bytes(data))
+
+
+def _expected_bytes(path) -> bytes:
+    """Pixel data as PIL decodes it"""
+    return Image.open(path).convert(config.SPRITE_FORMAT).tobytes()
+
+
+class TestSpriteBytes:
+    """Tests for SpriteManager.get_sprite_bytes() and the 1-bit BMP fast path"""
+
+    @pytest.mark.parametrize("white_first", [False, True], ids=["black_first", "white_first"])
+    @pytest.mark.parametrize("top_down", [False, True], ids=["bottom_up", "top_down"])
+    def test_1bit_bmp_matches_pil(self, tmp_path, white_first, top_down):
+        """Fast-path bytes equal PIL's packing for every row order and palette"""
+        path = tmp_path / "sprite.bmp"
+        _write_1bit_bmp(path, _random_sprite(), white_first=white_first, top_down=top_down)
+        manager = SpriteManager(str(tmp_path))
+
+        expected = _expected_bytes(path)
+        assert manager._fast_load_1bit_bmp(str(path)) == expected
+        assert manager.get_sprite_bytes("sprite.bmp") == expected
+
+    def test_load_sprite_matches_pil(self, tmp_path):
+        """load_sprite returns an image with the same pixels PIL decodes"""
+        path = tmp_path / "sprite.bmp"
+        _write_1bit_bmp(path, _random_sprite(), white_first=True)
+        manager = SpriteManager(str(tmp_path))
+
+        image = manager.load_sprite("sprite.bmp")
+
+        assert image.mode == config.SPRITE_FORMAT
+        assert image.size == config.SPRITE_SIZE
+        assert image.tobytes() == _expected_bytes(path)
+
+    def test_load_sprite_reuses_current_image(self, tmp_path):
+        """Repeated loads of the displayed sprite return the same image"""
+        _write_1bit_bmp(tmp_path / "a.bmp", _random_sprite(seed=1))
+        _write_1bit_bmp(tmp_path / "b.bmp", _random_sprite(seed=2))
+        manager = SpriteManager(str(tmp_path))
+
+        first = manager.load_sprite("a.bmp")
+        assert manager.load_sprite("a.bmp") is first
+
+        other = manager.load_sprite("b.bmp")
+        assert other is not first
+        assert other.tobytes() == _expected_bytes(tmp_path / "b.bmp")
+        assert manager.load_sprite("a.bmp").tobytes() == first.tobytes()
+
+        manager.clear_cache()
+        assert manager.load_sprite("b.bmp") is not other
+
+    def test_wrong_size_is_resized(self, tmp_path):
+        """Off-size sprites skip the fast path and are resized by PIL"""
+        path = tmp_path / "small.bmp"
+        _write_1bit_bmp(path, _random_sprite(size=(50, 50)))
+        manager = SpriteManager(str(tmp_path))
+
+        expected = (Image.open(path).resize(config.SPRITE_SIZE, Image.LANCZOS)
+                    .convert(config.SPRITE_FORMAT).tobytes())
+        assert manager._fast_load_1bit_bmp(str(path)) is None
+        assert manager.get_sprite_bytes("small.bmp") == expected
+
+    def test_non_1bit_bmp_is_converted(self, tmp_path):
+        """8-bit sprites skip the fast path and are converted by PIL"""
+        path = tmp_path / "gray.bmp"
+        _random_sprite().convert("L").save(path, "BMP")
+        manager = SpriteManager(str(tmp_path))
+
+        assert manager._fast_load_1bit_bmp(str(path)) is None
+        assert manager.get_sprite_bytes("gray.bmp") == _expected_bytes(path)
+
+    def test_missing_file_is_remembered(self, tmp_path):
+        """A missing sprite returns None and is not looked up again"""
+        manager = SpriteManager(str(tmp_path))
+
+        assert manager.get_sprite_bytes("missing.bmp") is None
+        assert "missing.bmp" in manager._missing_sprites
+        assert manager.get_cache_info() == {'cached': 0, 'missing': 1}
+
+    def test_unreadable_file_is_remembered(self, tmp_path):
+        """A file that isn't an image returns None and is marked missing"""
+        (tmp_path / "broken.bmp").write_bytes(b"not a bitmap")
+        manager = SpriteManager(str(tmp_path))
+
+        assert manager.get_sprite_bytes("broken.bmp") is None
+        assert "broken.bmp" in manager._missing_sprites
+
+
+class TestPreload:
+    """Tests for SpriteManager.preload_all_sprites()"""
+
+    def test_preload_loads_configured_sprites(self, tmp_path):
+        """Every configured sprite on disk is cached; the rest are missing"""
+        filenames = set(config.EMOTION_SPRITES.values()) | set(config.STAGE_SPRITES.values())
+        present = sorted(filenames)[::2]
+        for seed, filename in enumerate(present):
+            _write_1bit_bmp(tmp_path / filename, _random_sprite(seed=seed))
+        manager = SpriteManager(str(tmp_path))
+
+        manager.preload_all_sprites()
+
+        assert manager.get_cache_info() == {
+            'cached': len(present),
+            'missing': len(filenames) - len(present),
+        }
+        for filename in present:
+            assert manager.get_sprite_bytes(filename) == _expected_bytes(tmp_path / filename)
+
+    def test_list_available_sprites(self, tmp_path):
+        """Only BMP files are listed, sorted by name"""
+        for name in ("b.bmp", "a.bmp", "notes.txt"):
+            (tmp_path / name).write_bytes(b"")
+        manager = SpriteManager(str(tmp_path))
+
+        assert manager.list_available_sprites() == ["a.bmp", "b.bmp"]
+        assert SpriteManager(str(tmp_path / "absent")).list_available_sprites() == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
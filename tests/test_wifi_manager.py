@@ -0,0 +1,99 @@
+"""
+Unit Tests for NotaGotchi WiFi Manager
+
+Runs the TCP server on loopback; mDNS advertising is skipped.
+"""
+
+import sys
+import os
+import socket
+import threading
+import time
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# These tests rely on the pytest monkeypatch fixture
+import pytest
+
+from modules import config
+from modules.wifi_manager import WiFiManager
+
+
+def _free_port() -> int:
+    """Find a free TCP port on loopback"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+
+def _start_loopback_server(monkeypatch) -> WiFiManager:
+    """Start a WiFiManager server bound to a free port, without mDNS"""
+    manager = WiFiManager("notagotchi_Test", port=_free_port())
+    monkeypatch.setattr(manager, "get_local_ip", lambda ttl=None: "127.0.0.1")
+    monkeypatch.setattr(manager, "_setup_mdns", lambda local_ip=None: True)
+    assert manager.start_server()
+    return manager
+
+
+def _open_stalled_peers(port: int, count: int) -> list:
+    """Connect peers that never send anything or close"""
+    return [socket.create_connection(('127.0.0.1', port)) for _ in range(count)]
+
+
+class TestWiFiServerStalledPeers:
+    """Tests that silent peers can't block or hang the server"""
+
+    def test_stalled_peers_do_not_block_messages(self, monkeypatch):
+        """A message gets through while every handler worker was stalled"""
+        monkeypatch.setattr(config, "WIFI_CONNECTION_TIMEOUT", 0.5)
+        manager = _start_loopback_server(monkeypatch)
+        peers = _open_stalled_peers(manager.port, config.WIFI_HANDLER_WORKERS)
+        try:
+            # Let every worker pick up a stalled peer (with the short timeout)
+            time.sleep(0.2)
+            monkeypatch.setattr(config, "WIFI_CONNECTION_TIMEOUT", 5.0)
+
+            start = time.monotonic()
+            sent = manager.send_message('127.0.0.1', manager.port,
+                                        {'type': 'message', 'content': 'hi'})
+            elapsed = time.monotonic() - start
+
+            assert sent is True
+            assert elapsed < 3.0
+            message_data, sender_ip = manager.callback_queue.get(timeout=1.0)
+            assert message_data['content'] == 'hi'
+            assert sender_ip == '127.0.0.1'
+        finally:
+            for peer in peers:
+                peer.close()
+            manager.stop_server()
+
+    def test_stop_server_closes_stalled_connections(self, monkeypatch):
+        """stop_server closes open connections and releases the workers"""
+        manager = _start_loopback_server(monkeypatch)
+        peers = _open_stalled_peers(manager.port, 2)
+        try:
+            time.sleep(0.2)
+            manager.stop_server()
+
+            for peer in peers:
+                peer.settimeout(2.0)
+                assert peer.recv(1024) == b""  # Server side closed
+
+            deadline = time.monotonic() + 2.0
+            while time.monotonic() < deadline:
+                workers = [thread for thread in threading.enumerate()
+                           if thread.name.startswith("WiFiHandler")]
+                if not workers:
+                    break
+                time.sleep(0.05)
+            assert not workers
+            assert not manager.active_connections
+        finally:
+            for peer in peers:
+                peer.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])